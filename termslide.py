@@ -14,47 +14,57 @@ source as a normal code block. When exiting a presentation that contains Mermaid
 blocks without the library installed, TermSlide prints a reminder command to
 install it.
 
+Image slides
+------------
+Image slides require Pillow. If NumPy is installed, the per-cell pixel
+analysis runs as array operations instead of a pure Python loop; the rendered
+output is the same either way.
+
 Environment variables
 ---------------------
 - TERMSLIDE_MERMAID_ASCII_ONLY=1:
   Force ASCII-only output for Mermaid diagrams (disable box-drawing characters).
+- TERMSLIDE_RESAMPLE=lanczos|bicubic|bilinear:
+  Filter used to scale images to the terminal (default: lanczos). bicubic and
+  bilinear are faster for large images.
+- TERMSLIDE_ASCII_CHECKBOXES=1:
+  Draw task-list checkboxes as "[x]" / "[ ]". Read once at startup.
 """
 
 from __future__ import annotations
 
 import curses
+import functools
 import locale
 import os
 import re
 import sys
+import time
 import unicodedata
 import pathlib
 import hashlib
+import importlib.util
+import itertools
 import argparse
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, NamedTuple
 
-from pyfiglet import Figlet
-from pyfiglet import FigletFont
+# pyfiglet, NumPy, PyYAML and the Mermaid library are imported on first use
+# (see _figlet, _load_numpy, _load_yaml and _load_mermaid), so startup only
+# pays for what a deck actually needs. The *_AVAILABLE flags are set from
+# find_spec here and cleared if the import later fails.
 
 # Optional Mermaid support (pip install mermaid-ascii-diagrams).
 # The `mermaid-ascii-diagrams` project installs the `mermaid_ascii` module.
-try:
-    from mermaid_ascii import parse_mermaid as _parse_mermaid
-    from mermaid_ascii import render_ascii as _render_ascii
-
-    _MERMAID_LIB_AVAILABLE = True
-except Exception:
-    _parse_mermaid = None
-    _render_ascii = None
-    _MERMAID_LIB_AVAILABLE = False
+_parse_mermaid = None
+_render_ascii = None
+_MERMAID_LIB_AVAILABLE = importlib.util.find_spec("mermaid_ascii") is not None
 
-try:
-    import yaml
+yaml = None
+_YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
 
-    _YAML_AVAILABLE = True
-except Exception:
-    yaml = None
-    _YAML_AVAILABLE = False
+# Optional NumPy support speeds up image slide analysis (pip install numpy).
+np = None
+_NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
 
 # Tracks whether the current presentation contains any Mermaid blocks.
 _ENCOUNTERED_MERMAID_BLOCK = False
@@ -63,6 +73,18 @@ _ENCOUNTERED_MERMAID_BLOCK = False
 _MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB max file size
 _ALLOWED_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.gif'}
 _MAX_COLOR_PAIRS = 4096  # Soft cap for dynamic color pairs
+_SLIDE_FRAME_CACHE_SIZE = 64  # Composed slide frames kept for fast navigation
+
+# Markdown patterns, compiled once at import.
+# Links and images ([text](url) / ![alt](url)), matched in one pass.
+_MD_LINK_RE = re.compile(r'!?\[([^\]]*)\]\(([^)]+)\)')
+# Inline links/images for rendering; group 1 is "!" for images.
+_INLINE_LINK_RE = re.compile(r"(!?)\[([^\]]*)\]\(([^)]*)\)")
+# Inline emphasis: **bold**, *italic*, `code`; the group name is the style.
+_INLINE_FORMAT_RE = re.compile(r"\*\*(?P<bold>[^*]+)\*\*|\*(?P<italic>[^*]+)\*|`(?P<code>[^`]+)`")
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+_TITLE_UNDERLINE_RE = re.compile(r"^=+$")
+_IMAGE_ONLY_RE = re.compile(r'!\[([^\]]*)\]\((.*?)\)\s*')
 
 # Curses color pair IDs (keep stable; also used by render functions)
 PAIR_HEADING_1 = 2
@@ -82,6 +104,45 @@ _DEFAULT_FIGLET_TITLE_FONT = "standard"
 _DEFAULT_FIGLET_SLIDE_FONT = "small"
 
 
+class _FigletStyle(NamedTuple):
+    """Font and width for Figlet art; stands in for a `Figlet` instance.
+
+    Renderers only read `.font` and `.width`, so the (slow to build) Figlet
+    object is created by `_figlet_render` on first use, if ever.
+    """
+
+    font: str
+    width: int
+
+
+@functools.lru_cache(maxsize=None)
+def _figlet(font: str, width: int):
+    """Return a shared Figlet renderer for a font and output width."""
+    from pyfiglet import Figlet
+    return Figlet(font=font, width=width)
+
+
+@functools.lru_cache(maxsize=256)
+def _figlet_render(font: str, width: int, text: str) -> Tuple[str, ...]:
+    """Render `text` as Figlet art and return its lines (cached).
+
+    The output only depends on (font, width, text), so titles and headings
+    are composed once instead of on every redraw.
+    """
+    return tuple(_figlet(font, width).renderText(text).splitlines())
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_figlet_fonts() -> frozenset:
+    """Names of the fonts pyfiglet can load (cached).
+
+    `FigletFont.getFonts()` opens every font file to validate it, which takes
+    tens of milliseconds, so the listing is done once per run.
+    """
+    from pyfiglet import FigletFont
+    return frozenset(FigletFont.getFonts())
+
+
 def _safe_figlet_font(name: Any, fallback: str) -> str:
     """Return a valid figlet font name, otherwise a fallback.
 
@@ -93,7 +154,7 @@ def _safe_figlet_font(name: Any, fallback: str) -> str:
 
     font = name.strip()
     try:
-        if font in set(FigletFont.getFonts()):
+        if font in _installed_figlet_fonts():
             return font
     except Exception:
         pass
@@ -127,6 +188,11 @@ def _resolve_theme_color(color: Any) -> int:
 
 def _apply_theme_colors(theme: Dict[str, Any]) -> None:
     """Initialize curses color pairs from theme."""
+    global _BUILTIN_THEMES_RESOLVED
+    if not _BUILTIN_THEMES_RESOLVED:
+        _resolve_all_builtin_themes()
+        _BUILTIN_THEMES_RESOLVED = True
+
     colors = theme.get("colors", {})
 
     def pair(pid: int, role: str, default_fg: int, default_bg: int = -1) -> None:
@@ -301,18 +367,56 @@ _BUILTIN_THEMES: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Built-in RGB tuples are rewritten to 256-color indices on first use.
+_BUILTIN_THEMES_RESOLVED = False
+
+
+def _resolve_all_builtin_themes() -> None:
+    """Replace RGB tuples in the built-in themes with resolved color indices.
+
+    The built-in palettes are static, so mapping them once means later theme
+    activations only deal with plain ints.
+    """
+    for theme in _BUILTIN_THEMES.values():
+        for cfg in theme.get("colors", {}).values():
+            for key in ("fg", "bg"):
+                value = cfg.get(key)
+                if isinstance(value, tuple):
+                    cfg[key] = _resolve_theme_color(value)
+
+
+# Last TERMSLIDE_THEME value seen and the theme it resolved to.
+_ACTIVE_THEME_CACHE: List[Any] = [object(), None]
+
+
 def _get_active_theme() -> Dict[str, Any]:
-    name = (os.environ.get("TERMSLIDE_THEME") or "dark").strip().lower()
-    return _BUILTIN_THEMES.get(name, _BUILTIN_THEMES["dark"])
+    env = os.environ.get("TERMSLIDE_THEME")
+    # os.environ hands out a fresh string per lookup, so compare by value.
+    if _ACTIVE_THEME_CACHE[0] != env:
+        name = (env or "dark").strip().lower()
+        _ACTIVE_THEME_CACHE[:] = [env, _get_theme_by_name(name)]
+    return _ACTIVE_THEME_CACHE[1]
 
 
 def _get_theme_by_name(name: str) -> Dict[str, Any]:
     return _BUILTIN_THEMES.get(name, _BUILTIN_THEMES["dark"])
 
 
+def _load_yaml():
+    """Import PyYAML on first use; return the module, or None if unavailable."""
+    global yaml, _YAML_AVAILABLE
+    if yaml is None and _YAML_AVAILABLE:
+        try:
+            import yaml as _yaml
+            yaml = _yaml
+        except ImportError:
+            _YAML_AVAILABLE = False
+    return yaml if _YAML_AVAILABLE else None
+
+
 def _parse_yaml_theme(yaml_text: str) -> Dict[str, Any]:
     """Parse a YAML theme using safe_load + strict validation."""
-    if not _YAML_AVAILABLE or yaml is None:
+    if _load_yaml() is None:
         raise ValueError("PyYAML is not available")
 
     try:
@@ -472,7 +576,7 @@ BLOCK_CHARS = [
 
 # Character patterns for different brightness levels
 CHAR_PATTERNS = {
-    # Brightness range: (min, max) -> character
+    # Brightness range as a fraction of full scale: (min, max) -> character
     (0.0, 0.1): ' ',
     (0.1, 0.25): '░',
     (0.25, 0.4): '▒',
@@ -482,6 +586,20 @@ CHAR_PATTERNS = {
     (0.85, 1.0): '█',
 }
 
+# CHAR_PATTERNS expanded to one entry per 0..255 brightness value; values past
+# the last range get a full block.
+_BRIGHTNESS_CHARS = tuple(
+    next(
+        (char for (min_b, max_b), char in CHAR_PATTERNS.items() if min_b * 255 <= v < max_b * 255),
+        '█',
+    )
+    for v in range(256)
+)
+
+# Minimum top/bottom brightness difference (0..255 scale, ~0.3) for which a
+# cell is drawn as a half block instead of a density pattern.
+_HALF_BLOCK_CONTRAST = 77
+
 # Quarter block patterns for 2x2 pixel detail
 QUARTER_BLOCKS = {
 
@@ -501,6 +619,14 @@ QUARTER_BLOCKS = {
     (False, False, False, False): ' ',  # Empty
 }
 
+# QUARTER_BLOCKS indexed by a packed 4-bit pattern (tl | tr << 1 | bl << 2 |
+# br << 3) so the render loop does a tuple index instead of hashing a 4-tuple.
+# Patterns missing from QUARTER_BLOCKS fall back to a lower half block.
+_QUARTER_BLOCKS_TUPLE = tuple(
+    QUARTER_BLOCKS.get((bool(i & 1), bool(i & 2), bool(i & 4), bool(i & 8)), '▄')
+    for i in range(16)
+)
+
 
 def validate_file_path(file_path: str, base_dir: Optional[str] = None) -> str:
     """Validate file path to prevent path traversal attacks.
@@ -610,6 +736,21 @@ def validate_image_file(file_path: str) -> Tuple[str, bool]:
         raise ValueError(f"Image validation failed: {e}")
 
 
+def _sanitize_link_url(match: re.Match) -> str:
+    """`_MD_LINK_RE.sub` callback: replace links with dangerous URL schemes."""
+    full_match = match.group(0)
+    url = match.group(2)
+
+    # Remove javascript: and data: URLs
+    if url.lower().startswith(('javascript:', 'data:', 'vbscript:')):
+        # Return safe placeholder
+        if full_match.startswith('!'):
+            return "![Dangerous URL blocked]"
+        else:
+            return "[Dangerous URL blocked]"
+    return full_match
+
+
 def sanitize_markdown_content(content: str) -> str:
     """Sanitize markdown content to prevent injection attacks.
     
@@ -623,35 +764,17 @@ def sanitize_markdown_content(content: str) -> str:
         return ""
     
     # Remove null bytes and control characters except newlines and tabs
-    content = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', content)
+    content = _CONTROL_CHARS_RE.sub('', content)
     
     # Limit content length to prevent memory issues
     max_content_length = 10 * 1024 * 1024  # 10MB
     if len(content) > max_content_length:
         content = content[:max_content_length] + "\n[Content truncated due to length]"
     
-    # Sanitize potentially dangerous patterns in URLs
-    def sanitize_url(match):
-        full_match = match.group(0)
-        if len(match.groups()) >= 2:
-            text, url = match.group(1), match.group(2)
-        else:
-            text, url = match.group(1), match.group(1)
-        
-        # Remove javascript: and data: URLs
-        if url.lower().startswith(('javascript:', 'data:', 'vbscript:')):
-            # Return safe placeholder
-            if full_match.startswith('!'):
-                return f"![Dangerous URL blocked]"
-            else:
-                return f"[Dangerous URL blocked]"
-        return full_match
-    
-    # Sanitize link URLs: [text](url)
-    content = re.sub(r'\[([^\]]*)\]\(([^)]+)\)', lambda m: sanitize_url(m), content)
-    
-    # Sanitize image URLs: ![alt](url)
-    content = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', lambda m: sanitize_url(m), content)
+    # Sanitize link and image URLs: [text](url) / ![alt](url). Every link
+    # contains "](", so documents without one skip the regex pass.
+    if "](" in content:
+        content = _MD_LINK_RE.sub(_sanitize_link_url, content)
     
     # Limit nested code blocks to prevent stack overflow
     code_block_count = content.count('```')
@@ -708,6 +831,29 @@ def validate_color_pair_allocation(pair_id: int) -> bool:
     return 0 <= pair_id < _color_pair_capacity()
 
 
+# Last available-memory reading: [timestamp, bytes or None if psutil is missing].
+_MEM_CACHE: List[Any] = [0.0, None]
+_MEM_CACHE_TTL = 0.5  # Seconds
+
+
+def _available_memory() -> Optional[int]:
+    """Return available system memory in bytes, or None without psutil.
+
+    The reading is reused for a short window so that bursts of image checks
+    (load, resize, canvas) don't each parse /proc/meminfo.
+    """
+    now = time.monotonic()
+    if _MEM_CACHE[0] and now - _MEM_CACHE[0] <= _MEM_CACHE_TTL:
+        return _MEM_CACHE[1]
+    try:
+        import psutil
+        available = psutil.virtual_memory().available
+    except ImportError:
+        available = None
+    _MEM_CACHE[:] = [now, available]
+    return available
+
+
 def check_memory_availability(required_bytes: int) -> bool:
     """Check if enough memory is available for image processing.
     
@@ -717,13 +863,11 @@ def check_memory_availability(required_bytes: int) -> bool:
     Returns:
         True if memory is available, False otherwise
     """
-    try:
-        import psutil
-        available = psutil.virtual_memory().available
-        return available > required_bytes + (100 * 1024 * 1024)  # 100MB buffer
-    except ImportError:
+    available = _available_memory()
+    if available is None:
         # If psutil is not available, make a reasonable estimate
         return required_bytes < _MAX_IMAGE_MEMORY
+    return available > required_bytes + (100 * 1024 * 1024)  # 100MB buffer
 
 
 def estimate_image_memory_usage(width: int, height: int, channels: int = 3) -> int:
@@ -760,7 +904,7 @@ def validate_image_dimensions(img_path: str) -> Tuple[bool, Optional[tuple], Opt
     Returns:
         Tuple of (is_valid, dimensions, error_message)
     """
-    if Image is None:
+    if _load_pil() is None:
         return False, None, "Pillow not available"
     
     try:
@@ -782,16 +926,19 @@ def validate_image_dimensions(img_path: str) -> Tuple[bool, Optional[tuple], Opt
         return False, None, f"Failed to validate image: {e}"
 
 
-def safe_load_image(img_path: str) -> Optional[object]:
+def safe_load_image(img_path: str, target_size: Optional[Tuple[int, int]] = None) -> Optional[object]:
     """Safely load an image with comprehensive error handling.
     
     Args:
         img_path: Path to the image file
+        target_size: Optional (width, height) the image will be shown at. JPEGs
+            are then decoded at the smallest 1/2, 1/4 or 1/8 scale that still
+            covers it, which skips most of the decode work for large photos.
         
     Returns:
         PIL Image object or None if loading failed
     """
-    if Image is None:
+    if _load_pil() is None:
         return None
     
     try:
@@ -803,14 +950,22 @@ def safe_load_image(img_path: str) -> Optional[object]:
         
         # Load the image with error handling
         with Image.open(img_path) as img:
-            # Verify the image can be converted to RGB
-            img = img.convert("RGB")
+            # Let the JPEG decoder downscale while decoding
+            drafted = False
+            if target_size and img.format == "JPEG":
+                img.draft("RGB", target_size)
+                drafted = img.size != dimensions
+
+            # Verify the image can be converted to RGB. convert() always
+            # returns a new, fully loaded image detached from the file, so it
+            # is safe to return after the file is closed without a copy.
+            rgb = img.convert("RGB")
             
             # Double-check dimensions after conversion
-            if img.size != dimensions:
+            if rgb.size != dimensions and not drafted:
                 print(f"Warning: Image size changed after conversion", file=sys.stderr)
             
-            return img.copy()  # Return a copy to avoid file handle issues
+            return rgb
             
     except Exception as e:
         # Handle specific PIL errors
@@ -843,31 +998,16 @@ def safe_resize_image(img, target_width: int, target_height: int):
             print(f"Insufficient memory for image resize", file=sys.stderr)
             return None
         
-        # Progressive resizing for very large images to save memory
-        original_width, original_height = getattr(img, 'size', (0, 0))
-        if max(original_width, original_height) > 4096:
-            # Multi-step downscaling for large images
-            intermediate_width = max(original_width // 2, target_width * 2)
-            intermediate_height = max(original_height // 2, target_height * 2)
-            
-            # First step: resize to intermediate size
-            try:
-                lanczos = getattr(Image, 'LANCZOS', Image.BILINEAR if Image else None)
-                intermediate = img.resize((intermediate_width, intermediate_height), lanczos)
-                # Second step: resize to target size
-                resized = intermediate.resize((target_width, target_height), lanczos)
-                intermediate.close()
-            except Exception:
-                # Fallback to single-step resize
-                resized = img.resize((target_width, target_height))
-        else:
-            # Direct resize for smaller images
-            try:
-                lanczos = getattr(Image, 'LANCZOS', Image.BILINEAR if Image else None)
-                resized = img.resize((target_width, target_height), lanczos)
-            except Exception:
-                # Fallback to default resampling
-                resized = img.resize((target_width, target_height))
+        # Single-pass resize: Pillow's filters handle arbitrary downscale
+        # factors with correct antialiasing, so large images don't need an
+        # intermediate step. The filter is chosen by TERMSLIDE_RESAMPLE.
+        try:
+            _load_pil()
+            resample = getattr(Image, _RESAMPLE_FILTER.upper(), Image.BILINEAR)
+            resized = img.resize((target_width, target_height), resample)
+        except Exception:
+            # Fallback to default resampling
+            resized = img.resize((target_width, target_height))
         
         return resized
         
@@ -897,7 +1037,7 @@ def create_image_canvas_safely(target_width: int, target_height: int):
             return None
         
         # Create canvas
-        if Image:
+        if _load_pil():
             canvas = Image.new("RGB", (target_width, target_height), (0, 0, 0))
         else:
             return None
@@ -911,11 +1051,16 @@ def create_image_canvas_safely(target_width: int, target_height: int):
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def calculate_brightness(color):
-    """Calculate perceived brightness of an RGB color."""
+    """Calculate perceived brightness of an RGB color as an int in 0..255.
+
+    Cached: images reuse a small palette (flat regions, letterbox borders), so
+    most calls are repeats. `color` must be a hashable (r, g, b) tuple.
+    """
     r, g, b = color
-    # Weighted luminance formula
-    return (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
+    # Weighted luminance formula (Rec. 601 weights scaled to 256, integer math)
+    return (77 * r + 150 * g + 29 * b) >> 8
 
 
 def select_optimal_char(top_brightness, bottom_brightness, top_color, bottom_color):
@@ -924,23 +1069,20 @@ def select_optimal_char(top_brightness, bottom_brightness, top_color, bottom_col
     brightness_diff = abs(top_brightness - bottom_brightness)
     
     # If colors are very different, use half blocks
-    if brightness_diff > 0.3:
+    if brightness_diff >= _HALF_BLOCK_CONTRAST:
         if top_brightness > bottom_brightness:
             return '▀'  # Upper half block
         else:
             return '▄'  # Lower half block
     else:
         # Colors are similar, use density patterns
-        avg_brightness = (top_brightness + bottom_brightness) / 2
+        avg_brightness = (top_brightness + bottom_brightness) // 2
         return select_char_by_brightness(avg_brightness)
 
 
 def select_char_by_brightness(brightness):
-    """Select character based on brightness value."""
-    for (min_b, max_b), char in CHAR_PATTERNS.items():
-        if min_b <= brightness < max_b:
-            return char
-    return '█'  # Default to full block
+    """Select character based on brightness value (0..255)."""
+    return _BRIGHTNESS_CHARS[brightness]
 
 
 def get_optimal_color_pair(fg_color, bg_color):
@@ -948,15 +1090,18 @@ def get_optimal_color_pair(fg_color, bg_color):
 
     Returns (fg_idx, bg_idx) after quantization.
     """
-    fg_q = quantize_rgb(fg_color)
-    bg_q = quantize_rgb(bg_color)
-    fg_idx = rgb_to_ansi256(*fg_q)
-    bg_idx = rgb_to_ansi256(*bg_q)
-    return (fg_idx, bg_idx)
+    return (_rgb_to_ansi_idx(fg_color), _rgb_to_ansi_idx(bg_color))
 
 
 def analyze_2x2_pixels(canvas, x, y, width, height):
-    """Analyze a 2x2 pixel area for detailed character selection."""
+    """Analyze a 2x2 pixel area for detailed character selection.
+
+    `canvas` is a PIL image or an (H, W, 3) uint8 array, as produced by
+    `_letterbox_image`.
+    """
+    if _load_numpy() is not None and isinstance(canvas, np.ndarray):
+        return _analyze_2x2_block(canvas, x, y, width, height)
+
     pixels = []
     
     # Collect up to 4 pixels (handle edges)
@@ -975,7 +1120,7 @@ def analyze_2x2_pixels(canvas, x, y, width, height):
     if len(pixels) == 4:
         avg_color = tuple(sum(p[i] for p in pixels) // 4 for i in range(3))
         brightnesses = [calculate_brightness(p) for p in pixels]
-        avg_brightness = sum(brightnesses) / 4
+        avg_brightness = sum(brightnesses) // 4
         
         # Determine which quadrants are "filled" (above average brightness)
         threshold = avg_brightness
@@ -991,103 +1136,319 @@ def analyze_2x2_pixels(canvas, x, y, width, height):
         if pixels:
             avg_color = tuple(sum(p[i] for p in pixels) // len(pixels) for i in range(3))
             brightnesses = [calculate_brightness(p) for p in pixels]
-            avg_brightness = sum(brightnesses) / len(brightnesses)
+            avg_brightness = sum(brightnesses) // len(brightnesses)
             char = select_char_by_brightness(avg_brightness)
             return char, avg_color
         else:
             return ' ', (0, 0, 0)
 
 
+def _analyze_2x2_block(arr, x, y, width, height):
+    """`analyze_2x2_pixels` for an ndarray canvas, on a 2x2 slice of it."""
+    # Out of bounds = black
+    block = np.zeros((2, 2, 3), dtype=np.int32)
+    y0, y1 = max(y, 0), min(y + 2, height)
+    x0, x1 = max(x, 0), min(x + 2, width)
+    if y0 < y1 and x0 < x1:
+        block[y0 - y:y1 - y, x0 - x:x1 - x] = arr[y0:y1, x0:x1]
+    block = block.reshape(4, 3)
+
+    avg_color = tuple((block.sum(axis=0) // 4).tolist())
+    brightnesses = (block @ np.array([77, 150, 29], dtype=np.int32)) >> 8
+    avg_brightness = int(brightnesses.sum()) // 4
+
+    # Determine which quadrants are "filled" (above average brightness)
+    pattern_key = tuple((brightnesses > avg_brightness).tolist())
+    char = QUARTER_BLOCKS.get(pattern_key, select_char_by_brightness(avg_brightness))
+    return char, avg_color
+
+
+def _analyze_image_cell(pixels, x, y, width, height, use_advanced=True):
+    """Pick the block character and colors for one terminal cell.
+
+    `pixels` is the canvas pixel access object (`canvas.load()`). The cell
+    covers pixels (x, 2y) and (x, 2y + 1). When the pixel to the right is
+    available, a 2x2 area is analyzed to pick a quarter block.
+
+    Returns (char, fg_color, bg_color).
+    """
+    # Get the two pixels for this character position
+    top = pixels[x, y * 2]
+    if y * 2 + 1 < height:
+        bot = pixels[x, y * 2 + 1]
+    else:
+        bot = (0, 0, 0)
+
+    # Enhanced character selection based on pixel analysis
+    top_b = calculate_brightness(top)
+    bot_b = calculate_brightness(bot)
+
+    # Use 2x2 pixel analysis if we have neighboring pixels
+    if use_advanced and x + 1 < width and y * 2 + 1 < height:
+        # Look at a 2x2 area for better character selection
+        try:
+            right_top = pixels[x + 1, y * 2]
+            right_bot = pixels[x + 1, y * 2 + 1]
+
+            # Analyze all 4 pixels for optimal character, reusing the
+            # brightness already computed for this cell's own pixels
+            avg_color = (
+                (top[0] + bot[0] + right_top[0] + right_bot[0]) // 4,
+                (top[1] + bot[1] + right_top[1] + right_bot[1]) // 4,
+                (top[2] + bot[2] + right_top[2] + right_bot[2]) // 4,
+            )
+            right_top_b = calculate_brightness(right_top)
+            right_bot_b = calculate_brightness(right_bot)
+            threshold = (top_b + bot_b + right_top_b + right_bot_b) / 4
+
+            # Determine filled quadrants, packed into a 4-bit pattern
+            pattern = (
+                (top_b > threshold)              # top-left
+                | (right_top_b > threshold) << 1  # top-right
+                | (bot_b > threshold) << 2        # bottom-left
+                | (right_bot_b > threshold) << 3  # bottom-right
+            )
+
+            # Select character based on quadrant pattern
+            char = _QUARTER_BLOCKS_TUPLE[pattern]
+            return char, avg_color, top
+
+        except Exception:
+            # Fall back to simple analysis
+            pass
+
+    # Simple analysis for edge pixels
+    char = select_optimal_char(top_b, bot_b, top, bot)
+    color = top if top_b > bot_b else bot
+    return char, color, top
+
+
+def _select_image_cells_np(pixels, rows, cols, use_advanced=True):
+    """Vectorized `_analyze_image_cell` over the top-left rows x cols cells.
+
+    `pixels` is the canvas as a (height, width, 3) uint8 array. Brightness,
+    quadrant thresholds and character choice are computed with NumPy array
+    operations; the results match the scalar path exactly. The kernel only
+    touches arrays, never Python objects.
+
+    Colors are mapped straight to 256-color indices through the cube lookup
+    table, the same mapping as rgb_to_ansi256.
+
+    Returns (chars, fg_idx, bg_idx) arrays of shape (rows, cols).
+    """
+    height, width = pixels.shape[:2]
+    arr = pixels.astype(np.int32)
+
+    # Cell rows sample even (top) and odd (bottom) pixel rows; a missing
+    # bottom row at the image edge is black. One extra column is kept so the
+    # 2x2 analysis can see its right-hand neighbors.
+    ext = min(cols + 1, width)
+    top_ext = arr[0:rows * 2:2, :ext]
+    bot_ext = np.zeros_like(top_ext)
+    odd = arr[1:rows * 2:2, :ext]
+    bot_ext[:odd.shape[0]] = odd
+    top = top_ext[:, :cols]
+    bot = bot_ext[:, :cols]
+
+    def brightness(a):
+        # Same integer expression as calculate_brightness.
+        return (77 * a[..., 0] + 150 * a[..., 1] + 29 * a[..., 2]) >> 8
+
+    # Brightness is computed once over the extended columns; the cell and
+    # right-hand neighbor values below are views into these.
+    top_ext_b = brightness(top_ext)
+    bot_ext_b = brightness(bot_ext)
+
+    # Simple analysis (select_optimal_char) for every cell.
+    top_b = top_ext_b[:, :cols]
+    bot_b = bot_ext_b[:, :cols]
+    top_brighter = top_b > bot_b
+    chars = np.where(
+        np.abs(top_b - bot_b) >= _HALF_BLOCK_CONTRAST,
+        np.where(top_brighter, '▀', '▄'),
+        _BRIGHTNESS_CHARS_NP[(top_b + bot_b) // 2],
+    )
+    fg = np.where(top_brighter[..., None], top, bot)
+
+    # 2x2 analysis where both the bottom and right-hand pixels exist.
+    adv_rows = min(rows, height // 2)
+    adv_cols = ext - 1
+    if use_advanced and adv_rows > 0 and adv_cols > 0:
+        t = top[:adv_rows, :adv_cols]
+        b = bot[:adv_rows, :adv_cols]
+        rt = top_ext[:adv_rows, 1:]
+        rb = bot_ext[:adv_rows, 1:]
+        bt = top_b[:adv_rows, :adv_cols]
+        bb = bot_b[:adv_rows, :adv_cols]
+        brt = top_ext_b[:adv_rows, 1:]
+        brb = bot_ext_b[:adv_rows, 1:]
+        threshold = (bt + bb + brt + brb) / 4
+        pattern = (
+            (bt > threshold).astype(np.intp)
+            | ((brt > threshold) << 1)
+            | ((bb > threshold) << 2)
+            | ((brb > threshold) << 3)
+        )
+        chars[:adv_rows, :adv_cols] = _QUARTER_BLOCKS_NP[pattern]
+        fg[:adv_rows, :adv_cols] = (t + b + rt + rb) // 4
+
+    return chars, _ansi_index_np(fg), _ansi_index_np(top)
+
+
+def _ansi_index_np(a):
+    """`_rgb_to_ansi_idx` over an (..., 3) array of 0..255 channel values."""
+    return _ANSI_RED_NP[a[..., 0]] + _ANSI_GREEN_NP[a[..., 1]] + _ANSI_CUBE_LEVEL_NP[a[..., 2]]
+
+
+def _color_runs_np(fg, bg):
+    """Run-length encode two (rows, cols) color index arrays along each row.
+
+    Returns one list per row of (start_x, end_x, fg_idx, bg_idx) runs of
+    cells with equal colors. Run boundaries and their colors are found for
+    the whole grid in a few array operations, so Python only ever handles
+    one tuple per run.
+    """
+    rows, cols = fg.shape
+    starts = np.ones((rows, cols), dtype=bool)
+    starts[:, 1:] = (fg[:, 1:] != fg[:, :-1]) | (bg[:, 1:] != bg[:, :-1])
+    # Row-major positions of all run starts. Column 0 always starts a run, so
+    # a run ends where the next one starts, or at the end of the grid.
+    flat = np.flatnonzero(starts)
+    row_of = flat // cols
+    row_base = row_of * cols
+    xs = flat - row_base
+    ends = np.append(flat[1:], rows * cols) - row_base
+    runs = list(zip(xs.tolist(), ends.tolist(), fg.ravel()[flat].tolist(), bg.ravel()[flat].tolist()))
+    offsets = np.searchsorted(flat, np.arange(rows + 1) * cols).tolist()
+    return [runs[offsets[y]:offsets[y + 1]] for y in range(rows)]
+
+
+def _draw_pair_runs(stdscr, y, row) -> int:
+    """Draw a row of (x, text, pair_id) pieces, one addstr per color run.
+
+    Adjacent pieces sharing a color pair are joined into a single string so
+    curses sees one addstr per run instead of per cell. Every character of
+    `text` is one cell wide.
+
+    Returns the number of runs that failed to draw.
+    """
+    errors = 0
+    i = 0
+    n = len(row)
+    while i < n:
+        start_x, text, pair_id = row[i]
+        end_x = start_x + len(text)
+        j = i + 1
+        while j < n and row[j][2] == pair_id and row[j][0] == end_x:
+            end_x += len(row[j][1])
+            j += 1
+        if j > i + 1:
+            text = "".join(piece[1] for piece in row[i:j])
+        try:
+            stdscr.addstr(y, start_x, text, curses.color_pair(pair_id))
+        except Exception:
+            errors += 1
+        i = j
+    return errors
+
+
+# Color pairs set up by the last image render:
+# [canvas, layout, color_cache, solid_cache, next_pair_ref]. Pairs from 50 up
+# are only initialized by image rendering, so when the same canvas is drawn
+# again the same way (e.g. paging back to an image slide) they still hold the
+# right colors and no init_pair calls are needed.
+_IMAGE_PAIR_STATE: List[Any] = [None, None, {}, {}, [50]]
+
+
 def render_image_enhanced(stdscr, canvas, width, height, use_advanced=True):
-    """Enhanced image rendering using multiple block characters while maintaining same dimensions."""
+    """Enhanced image rendering using multiple block characters while maintaining same dimensions.
+
+    `canvas` is a PIL RGB image or, when NumPy is available, an (H, W, 3)
+    uint8 array.
+    """
     h, w = stdscr.getmaxyx()
-    color_cache: Dict[tuple, int] = {}
-    next_pair_ref = [50]
     render_errors = 0
-    
-    # Use same dimensions as original simple rendering
-    # Each terminal character represents 1 horizontal pixel, 2 vertical pixels
-    # But we'll choose better characters based on pixel analysis
-    
-    # Center the image like original
-    off_x = (w - width) // 2 if width < w else 0
-    off_y = ((h - 1) - height // 2) // 2 if height // 2 < h - 1 else 0
-    
-    # Pre-calculate color cache for better performance
-    # (Capacity logic handled in _get_or_create_color_pair).
-    
-    for y in range(h - 1):
-        for x in range(w):
+
+    # Each terminal character represents 1 horizontal pixel, 2 vertical pixels,
+    # but we choose better characters based on pixel analysis.
+    rows = max(0, min(h - 1, (height + 1) // 2))
+    cols = max(0, min(w, width))
+
+    # Redrawing the same canvas allocates the same pairs in the same order,
+    # so the previous render's allocation can be reused as-is.
+    layout = (width, height, rows, cols, use_advanced)
+    state = _IMAGE_PAIR_STATE
+    if state[0] is not canvas or state[1] != layout:
+        state[:] = [canvas, layout, {}, {}, [50]]
+    color_cache: Dict[tuple, int] = state[2]
+    solid_cache: Dict[int, tuple] = state[3]
+    next_pair_ref = state[4]
+
+    cells = None
+    if rows and cols and _load_numpy() is not None:
+        try:
+            pixels = np.asarray(canvas, dtype=np.uint8)[:height, :width]
+            chars, fg, bg = _select_image_cells_np(pixels, rows, cols, use_advanced)
+            # Cells are handled a run of equal (fg, bg) at a time: every cell
+            # in a run gets the same color pair, so the pair bookkeeping below
+            # runs once per run rather than once per cell.
+            cells = (chars.tolist(), _color_runs_np(fg, bg))
+        except Exception:
+            cells = None
+    if cells is None:
+        if np is not None and isinstance(canvas, np.ndarray):
+            canvas = _load_pil().fromarray(canvas)
+        # Read pixels through the loaded raster rather than per-call getpixel.
+        pixels = canvas.load()
+
+    # Adjacent cells often share colors; remember the last pair looked up.
+    last_fg = last_bg = pair_id = -1
+
+    for y in range(rows):
+        row = []
+        if cells is not None:
+            row_chars = cells[0][y]
+            spans = cells[1][y]
+        else:
+            spans = ((x, x + 1, None, None) for x in range(cols))
+        for x, end, fg_idx, bg_idx in spans:
             try:
-                # Check bounds like original
-                if y * 2 >= height or x >= width:
-                    continue
-                
-                # Get the two pixels for this character position
-                top = canvas.getpixel((x, y * 2))
-                if y * 2 + 1 < height:
-                    bot = canvas.getpixel((x, y * 2 + 1))
+                if cells is not None:
+                    char = row_chars[x]
                 else:
-                    bot = (0, 0, 0)
-                
-                # Enhanced character selection based on pixel analysis
-                top_b = calculate_brightness(top)
-                bot_b = calculate_brightness(bot)
-                
-                # Use 2x2 pixel analysis if we have neighboring pixels
-                if use_advanced and x + 1 < width and y * 2 + 1 < height:
-                    # Look at a 2x2 area for better character selection
-                    try:
-                        next_right_top = canvas.getpixel((x + 1, y * 2))
-                        next_right_bot = canvas.getpixel((x + 1, y * 2 + 1))
-                        
-                        # Analyze all 4 pixels for optimal character
-                        avg_color = tuple((top[i] + bot[i] + next_right_top[i] + next_right_bot[i]) // 4 for i in range(3))
-                        pixels = [top, bot, next_right_top, next_right_bot]
-                        brightnesses = [calculate_brightness(p) for p in pixels]
-                        avg_brightness = sum(brightnesses) / 4
-                        
-                        # Determine filled quadrants
-                        threshold = avg_brightness
-                        tl = brightnesses[0] > threshold  # top-left
-                        tr = brightnesses[2] > threshold  # top-right  
-                        bl = brightnesses[1] > threshold  # bottom-left
-                        br = brightnesses[3] > threshold  # bottom-right
-                        
-                        # Select character based on quadrant pattern
-                        pattern_key = (tl, tr, bl, br)
-                        char = QUARTER_BLOCKS.get(pattern_key, '▄')
-                        color = avg_color
-                        
-                    except Exception:
-                        # Fall back to simple analysis
-                        char = select_optimal_char(top_b, bot_b, top, bot)
-                        color = top if top_b > bot_b else bot
-                else:
-                    # Simple analysis for edge pixels
-                    char = select_optimal_char(top_b, bot_b, top, bot)
-                    color = top if top_b > bot_b else bot
-                
-                # Get background color for color pair
-                bg_color = top  # Use top pixel as background
-                
+                    char, color, bg_color = _analyze_image_cell(pixels, x, y, width, height, use_advanced)
+                    fg_idx, bg_idx = get_optimal_color_pair(color, bg_color)
+
                 # Get or allocate a color pair (hybrid strategy)
-                pair_id = _get_or_create_color_pair(color_cache, next_pair_ref, fg_color=color, bg_color=bg_color)
-
-                # Render character
-                if pair_id > 0:
-                    stdscr.attron(curses.color_pair(pair_id))
-                stdscr.addstr(y, x, char)
-                if pair_id > 0:
-                    stdscr.attroff(curses.color_pair(pair_id))
-                    
+                if fg_idx == bg_idx:
+                    # Flat cell: keep the current pair if it shows this color.
+                    if bg_idx == last_bg:
+                        char = ' '
+                    elif fg_idx == last_fg:
+                        char = '█'
+                    else:
+                        char, pair_id = _get_solid_cell(color_cache, solid_cache, next_pair_ref, fg_idx)
+                        last_fg = last_bg = -1
+                    # The rest of a flat run draws the same way.
+                    text = char * (end - x)
+                else:
+                    if fg_idx != last_fg or bg_idx != last_bg:
+                        pair_id = _get_or_create_index_pair(color_cache, next_pair_ref, fg_idx, bg_idx)
+                        last_fg, last_bg = fg_idx, bg_idx
+                    text = char if end == x + 1 else "".join(row_chars[x:end])
+
+                row.append((x, text, pair_id))
+
             except Exception:
                 render_errors += 1
                 if render_errors > 100:
                     break
+
+        # Render the row, one curses write per run of same-colored cells
+        render_errors += _draw_pair_runs(stdscr, y, row)
         if render_errors > 100:
             break
-    
+
     return render_errors
 
 
@@ -1095,36 +1456,41 @@ def render_image_simple(stdscr, canvas, width, height):
     """Simple image rendering using half-block characters."""
     h, w = stdscr.getmaxyx()
     color_cache: Dict[tuple, int] = {}
+    solid_cache: Dict[int, tuple] = {}
     next_pair_ref = [50]
     render_errors = 0
+    pixels = canvas.load()
     
     for y in range(h - 1):
+        row = []
         for x in range(w):
             try:
                 # Get pixels with bounds checking
                 if y * 2 >= height or x >= width:
                     continue
                     
-                top = canvas.getpixel((x, y * 2))
+                top = pixels[x, y * 2]
                 if y * 2 + 1 < height:
-                    bot = canvas.getpixel((x, y * 2 + 1))
+                    bot = pixels[x, y * 2 + 1]
                 else:
                     bot = (0, 0, 0)  # Black for out-of-bounds
                     
                 # Get or allocate a color pair (hybrid strategy)
-                pair_id = _get_or_create_color_pair(color_cache, next_pair_ref, fg_color=bot, bg_color=top)
-
-                # Render pixel
-                if pair_id > 0:
-                    stdscr.attron(curses.color_pair(pair_id))
-                stdscr.addstr(y, x, "▄")
-                if pair_id > 0:
-                    stdscr.attroff(curses.color_pair(pair_id))
+                fg_idx, bg_idx = get_optimal_color_pair(bot, top)
+                if fg_idx == bg_idx:
+                    char, pair_id = _get_solid_cell(color_cache, solid_cache, next_pair_ref, fg_idx)
+                else:
+                    char = "▄"
+                    pair_id = _get_or_create_index_pair(color_cache, next_pair_ref, fg_idx, bg_idx)
+                row.append((x, char, pair_id))
                     
             except Exception:
                 render_errors += 1
                 if render_errors > 100:
                     break
+
+        # Render pixels, one curses write per run of same-colored cells
+        render_errors += _draw_pair_runs(stdscr, y, row)
         if render_errors > 100:
             break
     
@@ -1136,20 +1502,32 @@ def _terminal_encoding() -> str:
     return safe_terminal_encoding()
 
 
+# Box-drawing glyphs used by the Unicode output paths.
+_BOX_GLYPHS = "┌─│┐└┘┼►"
+
+# Box-drawing characters should not be combining marks. This only depends on
+# the Unicode database, so it is checked once at import.
+_BOX_GLYPHS_NON_COMBINING = not any(unicodedata.combining(ch) for ch in _BOX_GLYPHS)
+
+
+@functools.lru_cache(maxsize=1)
 def _utf8_probably_supported() -> bool:
-    """Heuristic for whether Unicode box drawing is likely to render correctly."""
+    """Heuristic for whether Unicode box drawing is likely to render correctly.
+
+    The terminal encoding does not change while we run, so the answer is
+    computed once and cached.
+    """
     enc = _terminal_encoding()
     if "utf" not in enc:
         return False
 
     # Ensure the chosen glyphs can be encoded in the terminal encoding.
     try:
-        "┌─│┐└┘┼►".encode(enc, errors="strict")
+        _BOX_GLYPHS.encode(enc, errors="strict")
     except Exception:
         return False
 
-    # Box-drawing characters should not be combining marks.
-    return not any(unicodedata.combining(ch) for ch in "┌─│┐└┘┼►")
+    return _BOX_GLYPHS_NON_COMBINING
 
 
 # Prefer Unicode box drawing when UTF-8 looks supported; otherwise fall back to ASCII.
@@ -1159,12 +1537,27 @@ _USE_ASCII_MERMAID_FALLBACK = not _utf8_probably_supported()
 if os.environ.get("TERMSLIDE_MERMAID_ASCII_ONLY"):
     _USE_ASCII_MERMAID_FALLBACK = True
 
+# Task-list checkboxes: Unicode ballot boxes unless UTF-8 looks unsupported or
+# TERMSLIDE_ASCII_CHECKBOXES forces "[x]" / "[ ]".
+_USE_ASCII_CHECKBOXES = bool(os.environ.get("TERMSLIDE_ASCII_CHECKBOXES")) or not _utf8_probably_supported()
+
 # Image rendering mode control
 _USE_ENHANCED_RENDERING = not os.environ.get("TERMSLIDE_SIMPLE_RENDERING")
 
+# Pillow resampling filter used to fit images to the terminal. Lanczos is the
+# sharpest; bicubic and bilinear are cheaper and look much the same at
+# terminal-cell resolution.
+_RESAMPLE_FILTERS = ("lanczos", "bicubic", "bilinear")
+_RESAMPLE_FILTER = os.environ.get("TERMSLIDE_RESAMPLE", "").strip().lower()
+if _RESAMPLE_FILTER not in _RESAMPLE_FILTERS:
+    _RESAMPLE_FILTER = "lanczos"
+
 # Unicode -> ASCII fallback map (helps terminals/fonts that don't render box-drawing cleanly).
-_UNICODE_TO_ASCII = str.maketrans(
-    {
+# Built as code point -> code point: str.translate copies int values straight
+# into the output, which is measurably faster than 1-char string values.
+_UNICODE_TO_ASCII = {
+    ord(src): ord(dst)
+    for src, dst in {
         "─": "-",
         "│": "|",
         "┌": "+",
@@ -1184,13 +1577,33 @@ _UNICODE_TO_ASCII = str.maketrans(
         "◄": "<",
         "▼": "v",
         "▲": "^",
-    }
-)
+    }.items()
+}
 
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
+# Pillow is imported on first use (see _load_pil) so text-only decks don't pay
+# for it at startup. Image stays None until then, or if it isn't installed.
+Image = None
+_PIL_IMPORT_TRIED = False
+
+
+def _load_pil():
+    """Import PIL.Image on first use; return the module, or None if missing."""
+    global Image, _PIL_IMPORT_TRIED
+    if not _PIL_IMPORT_TRIED:
+        _PIL_IMPORT_TRIED = True
+        try:
+            from PIL import Image as _pil_image
+            Image = _pil_image
+        except ImportError:
+            Image = None
+    return Image
+
+
+def _pil_installed() -> bool:
+    """Whether Pillow can be imported, without importing it."""
+    if _PIL_IMPORT_TRIED:
+        return Image is not None
+    return importlib.util.find_spec("PIL") is not None
 
 
 def parse_markdown(md_text):
@@ -1229,13 +1642,25 @@ def parse_markdown(md_text):
                     front_matter[k] = v
             md_text = body
 
+    # Slides are separated by lines of three or more dashes, optionally
+    # followed by whitespace.
+    raw_slides = []
+    chunk: List[str] = []
+    for line in md_text.split("\n"):
+        dashes = line.rstrip()
+        if len(dashes) >= 3 and not dashes.strip("-"):
+            raw_slides.append("\n".join(chunk))
+            chunk = []
+        else:
+            chunk.append(line)
+    raw_slides.append("\n".join(chunk))
+
     slides = []
-    raw_slides = re.split(r'^\-{3,}\s*$', md_text, flags=re.MULTILINE)
     for raw in raw_slides:
         lines = [line.rstrip() for line in raw.strip().splitlines()]
         if not any(l.strip() for l in lines):
             continue
-        if len(lines) > 1 and re.match(r"^=+$", lines[1].strip()):
+        if len(lines) > 1 and _TITLE_UNDERLINE_RE.match(lines[1].strip()):
             title = sanitize_markdown_content(lines[0].strip())
             content = sanitize_markdown_content("\n".join(lines[2:]))
             slides.append(("title", title, content))
@@ -1253,10 +1678,17 @@ def parse_markdown(md_text):
 
 def parse_image_only(content):
     """Detect slides that contain only an image and return (path, alt) if present."""
-    content = sanitize_markdown_content(content.strip())
+    content = content.strip()
+    # Multi-line content without a "[" can match neither the image syntax nor
+    # a bare path. Sanitizing doesn't change that: it never removes newlines,
+    # and the truncation notice it may append (the only "[" it adds) starts
+    # on a new line, so truncated content isn't a single image line either.
+    if not content or ("\n" in content and "[" not in content):
+        return None
+    content = sanitize_markdown_content(content)
     if not content:
         return None
-    m = re.fullmatch(r'!\[([^\]]*)\]\((.*?)\)\s*', content)
+    m = _IMAGE_ONLY_RE.fullmatch(content)
     if m:
         alt, path = m.groups()
         # Validate and check image file
@@ -1279,43 +1711,61 @@ def parse_image_only(content):
     return None
 
 
-def rgb_to_ansi256(r, g, b):
-    """Map an RGB tuple (0-255) to the nearest 256-color ANSI index."""
-    r_ = int(round(r / 255 * 5))
-    g_ = int(round(g / 255 * 5))
-    b_ = int(round(b / 255 * 5))
-    return 16 + 36 * r_ + 6 * g_ + b_
+# 6-level color cube lookup for 8-bit channel values: the cube level (0..5)
+# used by rgb_to_ansi256.
+# (v * 5 + 127) // 255 is round(v * 5 / 255) in integer math; v * 5 / 255 is
+# never exactly .5 for integer v, so there are no rounding ties to differ on.
+_ANSI_CUBE_LEVEL = bytes((v * 5 + 127) // 255 for v in range(256))
+
+# The cube level with each channel's share of the index folded in, so
+# 16 + 36*r + 6*g + b becomes three table loads and two additions.
+_ANSI_RED = bytes(16 + 36 * level for level in _ANSI_CUBE_LEVEL)
+_ANSI_GREEN = bytes(6 * level for level in _ANSI_CUBE_LEVEL)
 
 
-def quantize_rgb(color, levels: int = 6):
-    """Quantize an RGB color to reduce distinct fg/bg pairs.
+def _load_numpy():
+    """Import NumPy on first use; return the module, or None if unavailable.
 
-    levels=6 matches the 256-color cube (0..5), but quantizing early helps reduce
-    the number of distinct (fg,bg) pairs we attempt to allocate.
+    Also builds the array forms of the lookup tables used by the vectorized
+    image path (CHAR_PATTERNS, QUARTER_BLOCKS and the ANSI cube tables).
     """
-    r, g, b = color
-    step = 255 / max(1, (levels - 1))
+    global np, _NUMPY_AVAILABLE
+    global _BRIGHTNESS_CHARS_NP, _QUARTER_BLOCKS_NP
+    global _ANSI_RED_NP, _ANSI_GREEN_NP, _ANSI_CUBE_LEVEL_NP
+    if np is None and _NUMPY_AVAILABLE:
+        try:
+            import numpy
+        except ImportError:
+            _NUMPY_AVAILABLE = False
+            return None
+        _BRIGHTNESS_CHARS_NP = numpy.array(_BRIGHTNESS_CHARS)
+        _QUARTER_BLOCKS_NP = numpy.array(_QUARTER_BLOCKS_TUPLE)
+        _ANSI_RED_NP = numpy.frombuffer(_ANSI_RED, dtype=numpy.uint8).astype(numpy.int32)
+        _ANSI_GREEN_NP = numpy.frombuffer(_ANSI_GREEN, dtype=numpy.uint8).astype(numpy.int32)
+        _ANSI_CUBE_LEVEL_NP = numpy.frombuffer(_ANSI_CUBE_LEVEL, dtype=numpy.uint8).astype(numpy.int32)
+        np = numpy
+    return np if _NUMPY_AVAILABLE else None
+
+
+def rgb_to_ansi256(r, g, b):
+    """Map an RGB tuple (0-255) to the nearest 256-color ANSI index."""
+    return _ANSI_RED[r] + _ANSI_GREEN[g] + _ANSI_CUBE_LEVEL[b]
 
-    def q(v: int) -> int:
-        return int(round(v / step) * step)
 
-    return (q(r), q(g), q(b))
+@functools.lru_cache(maxsize=8192)
+def _rgb_to_ansi_idx(color) -> int:
+    """Map an (r, g, b) tuple to its 256-color index (cached)."""
+    return rgb_to_ansi256(*color)
 
 
-def _get_or_create_color_pair(color_cache: Dict[tuple, int], next_pair_ref: List[int], fg_color, bg_color) -> int:
-    """Get (or allocate) a curses color pair for a fg/bg combination.
+def _get_or_create_index_pair(color_cache: Dict[tuple, int], next_pair_ref: List[int], fg_idx: int, bg_idx: int) -> int:
+    """Get (or allocate) a curses color pair for a fg/bg pair of 256-color indices.
 
     Hybrid strategy:
-    - Quantize RGB to reduce unique combinations.
     - Allocate pairs up to a safe capacity.
     - When capacity is reached, reuse a stable hash bucket of existing pairs
       instead of falling back to 0 (default colors).
     """
-    fg_q = quantize_rgb(fg_color)
-    bg_q = quantize_rgb(bg_color)
-
-    fg_idx = rgb_to_ansi256(*fg_q)
-    bg_idx = rgb_to_ansi256(*bg_q)
     key = (fg_idx, bg_idx)
 
     if key in color_cache:
@@ -1339,12 +1789,45 @@ def _get_or_create_color_pair(color_cache: Dict[tuple, int], next_pair_ref: List
     allocated = next_pair_ref[0] - 50  # 50 is our starting point
     if allocated > 0:
         # Stable bucket within allocated range.
-        bucket = (hash(key) % allocated)
-        return 50 + bucket
+        pair_id = 50 + (fg_idx * 256 + bg_idx) % allocated
+        if next_pair_ref[0] >= cap:
+            # The table is full for good; remember the bucket so repeats of
+            # this combination are a plain cache hit. These entries always
+            # follow the allocated ones in color_cache.
+            color_cache[key] = pair_id
+        return pair_id
 
     return 0
 
 
+def _get_solid_cell(color_cache: Dict[tuple, int], solid_cache: Dict[int, tuple], next_pair_ref: List[int], idx: int) -> Tuple[str, int]:
+    """Pick a (char, pair_id) that draws a cell as flat color `idx`.
+
+    When fg and bg quantize to the same color the glyph is invisible, so any
+    existing pair with that background (drawn as ' ') or foreground (drawn as
+    '█') will do. Only when neither exists is an (idx, idx) pair allocated.
+    Results are remembered in `solid_cache`, keyed on the color index.
+    """
+    cell = solid_cache.get(idx)
+    if cell is not None:
+        return cell
+
+    # Only the first entries own their pair; later ones are reuse buckets.
+    allocated = itertools.islice(color_cache.items(), next_pair_ref[0] - 50)
+    cell = None
+    for (fg_idx, bg_idx), pair_id in allocated:
+        if bg_idx == idx:
+            cell = (' ', pair_id)
+            break
+        if fg_idx == idx and cell is None:
+            cell = ('█', pair_id)
+    if cell is None:
+        cell = (' ', _get_or_create_index_pair(color_cache, next_pair_ref, idx, idx))
+
+    solid_cache[idx] = cell
+    return cell
+
+
 def render_image_fallback(stdscr, img_path, alt):
     """Fallback image rendering that shows basic image info."""
     try:
@@ -1358,7 +1841,7 @@ def render_image_fallback(stdscr, img_path, alt):
         
         # Try to get image dimensions without fully loading
         try:
-            if Image:
+            if _load_pil():
                 with Image.open(img_path) as img:
                     width, height = getattr(img, 'size', (0, 0))
                     stdscr.addstr(4, 2, f"Dimensions: {width}x{height}")
@@ -1378,9 +1861,126 @@ def render_image_fallback(stdscr, img_path, alt):
         stdscr.addstr(2, 2, f"Cannot display image: {e}")
 
 
+def _letterbox_image(resized_img, tgt_w: int, tgt_h: int):
+    """Center a resized image on a black tgt_w x tgt_h canvas.
+
+    With NumPy the canvas is a uint8 array, which `render_image_enhanced`
+    reads directly: the resized pixels are copied into a zeroed array, or
+    converted as a whole when they already fill the target. Without NumPy an
+    image that fills the target is used as-is; otherwise a Pillow canvas is
+    created and pasted onto.
+
+    Returns the canvas (PIL Image or ndarray), or None if it can't be created.
+    """
+    new_w, new_h = resized_img.size
+    if (new_w, new_h) == (tgt_w, tgt_h):
+        # Convert once here so cached canvases aren't re-read on every render.
+        return np.asarray(resized_img, dtype=np.uint8) if _load_numpy() is not None else resized_img
+
+    off_x = (tgt_w - new_w) // 2
+    off_y = (tgt_h - new_h) // 2
+
+    if _load_numpy() is not None:
+        if not check_memory_availability(tgt_w * tgt_h * 3):
+            print(f"Insufficient memory for canvas creation", file=sys.stderr)
+            return None
+        canvas = np.zeros((tgt_h, tgt_w, 3), dtype=np.uint8)
+        canvas[off_y:off_y + new_h, off_x:off_x + new_w] = np.asarray(resized_img, dtype=np.uint8)
+        return canvas
+
+    canvas = create_image_canvas_safely(tgt_w, tgt_h)
+    if canvas is not None:
+        try:
+            canvas.paste(resized_img, (off_x, off_y))
+        except Exception:
+            canvas.close()
+            raise
+    return canvas
+
+
+def _build_image_canvas(img_path: str, tgt_w: int, tgt_h: int):
+    """Load, resize and letterbox an image to a tgt_w x tgt_h canvas.
+
+    Returns (canvas, error). On failure canvas is None and error is the
+    message to show on the slide, or None when there is nothing to show.
+    Unexpected exceptions propagate to the caller.
+    """
+    # Load and validate image safely
+    img = safe_load_image(img_path, (tgt_w, tgt_h))
+    if img is None:
+        return None, f"Failed to load image: {os.path.basename(img_path)}"
+
+    resized_img = None
+    canvas = None
+    try:
+        img_w, img_h = getattr(img, 'size', (0, 0))
+
+        # Calculate target dimensions with bounds checking
+        if img_w == 0 or img_h == 0:
+            return None, "Invalid image dimensions."
+
+        ratio = min(tgt_w / img_w, tgt_h / img_h)
+        new_w = max(1, min(tgt_w, int(img_w * ratio)))
+        new_h = max(1, min(tgt_h, int(img_h * ratio)))
+
+        # Resize image safely
+        resized_img = safe_resize_image(img, new_w, new_h)
+        if resized_img is None:
+            return None, "Failed to resize image."
+
+        # Center the resized image on a black canvas of the target size
+        try:
+            canvas = _letterbox_image(resized_img, tgt_w, tgt_h)
+        except Exception as e:
+            return None, f"Error pasting image to canvas: {e}"
+
+        if np is not None and isinstance(canvas, np.ndarray):
+            # The canvas may be cached and shared between renders.
+            canvas.flags.writeable = False
+        return canvas, None
+    finally:
+        # Close the intermediates; the canvas itself goes to the caller.
+        for im in (resized_img, img):
+            if im is not None and im is not canvas:
+                try:
+                    im.close()
+                except Exception:
+                    pass
+
+
+class _ImageCanvasError(Exception):
+    """Raised by `_cached_image_canvas` so failed builds aren't cached.
+
+    `error` is the message `_build_image_canvas` returned (possibly None).
+    """
+
+    def __init__(self, error: Optional[str]):
+        super().__init__(error)
+        self.error = error
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_image_canvas(img_path: str, tgt_w: int, tgt_h: int, mtime_ns: int, file_size: int):
+    """`_build_image_canvas`, cached per file version and target size.
+
+    Keying on mtime and size means an edited image is picked up on the next
+    render, while paging back and forth over an unchanged deck skips the
+    decode and Lanczos resize entirely. The returned canvas is shared and
+    must not be modified or closed.
+
+    Only canvases are cached: on failure this raises `_ImageCanvasError`,
+    which lru_cache doesn't store, so a transient problem such as a failed
+    memory check is retried on the next render.
+    """
+    canvas, error = _build_image_canvas(img_path, tgt_w, tgt_h)
+    if canvas is None:
+        raise _ImageCanvasError(error)
+    return canvas
+
+
 def render_image_in_curses(stdscr, img_path, alt):
     """Render an image slide using half-block characters (requires Pillow)."""
-    if Image is None:
+    if _load_pil() is None:
         stdscr.addstr(2, 2, "Pillow required for image slides.")
         return
 
@@ -1402,66 +2002,32 @@ def render_image_in_curses(stdscr, img_path, alt):
         stdscr.addstr(2, 2, "Terminal too large for safe image rendering.")
         return
 
-    # Load and validate image safely
-    img = safe_load_image(img_path)
-    if img is None:
-        stdscr.addstr(2, 2, f"Failed to load image: {os.path.basename(img_path)}")
-        return
-
     try:
-        img_w, img_h = getattr(img, 'size', (0, 0))
-        
-        # Calculate target dimensions with bounds checking
-        if img_w == 0 or img_h == 0:
-            stdscr.addstr(2, 2, "Invalid image dimensions.")
-            return
-            
-        ratio = min(tgt_w / img_w, tgt_h / img_h)
-        new_w = max(1, min(tgt_w, int(img_w * ratio)))
-        new_h = max(1, min(tgt_h, int(img_h * ratio)))
+        try:
+            st = os.stat(img_path)
+        except OSError:
+            # Nothing to key a cache entry on; let the loader report it.
+            canvas, error = _build_image_canvas(img_path, tgt_w, tgt_h)
+        else:
+            try:
+                canvas = _cached_image_canvas(img_path, tgt_w, tgt_h, st.st_mtime_ns, st.st_size)
+                error = None
+            except _ImageCanvasError as e:
+                canvas, error = None, e.error
 
-        # Resize image safely
-        resized_img = safe_resize_image(img, new_w, new_h)
-        if resized_img is None:
-            stdscr.addstr(2, 2, "Failed to resize image.")
+        if error:
+            stdscr.addstr(2, 2, error)
             return
-
-        # Create canvas safely
-        canvas = create_image_canvas_safely(tgt_w, tgt_h)
         if canvas is None:
             return
-            
-        try:
-            off_x = (tgt_w - new_w) // 2
-            off_y = (tgt_h - new_h) // 2
-            canvas.paste(resized_img, (off_x, off_y))
-        except Exception as e:
-            stdscr.addstr(2, 2, f"Error pasting image to canvas: {e}")
-            canvas.close()
-            return
 
         # Render image with enhanced block character rendering
         render_errors = render_image_enhanced(stdscr, canvas, tgt_w, tgt_h, _USE_ENHANCED_RENDERING)
 
-        # Cleanup
-        try:
-            if hasattr(canvas, 'close'):
-                canvas.close()
-            if hasattr(resized_img, 'close'):
-                resized_img.close()
-        except Exception:
-            pass
-
     except Exception as e:
         # Fallback to info display on any major error
         render_image_fallback(stdscr, img_path, alt)
         return
-    finally:
-        try:
-            if hasattr(img, 'close'):
-                img.close()
-        except Exception:
-            pass
 
     # Show navigation and status
     try:
@@ -1475,63 +2041,101 @@ def render_image_in_curses(stdscr, img_path, alt):
 def render_links(line, stdscr, y, x, maxw):
     """Render Markdown links/images inline with basic styling."""
     pos = 0
-    pattern = re.compile(r"(!?\[[^\]]*\]\([^)]*\))")
-    for match in pattern.finditer(line):
+    for match in _INLINE_LINK_RE.finditer(line):
         start, end = match.span()
         stdscr.addstr(y, x + pos, line[pos:start])
-        text = match.group(0)
-        img_match = re.match(r"!\[([^\]]*)\]\(([^)]*)\)", text)
-        link_match = re.match(r"\[([^\]]*)\]\(([^)]*)\)", text)
-        if img_match:
-            alt, url = img_match.groups()
-            stdscr.addstr(y, x + start, f"Image: {alt} ")
-            stdscr.attron(curses.color_pair(PAIR_LINK))
-            stdscr.addstr(y, x + start + len(f"Image: {alt} "), f"({url})"[: maxw - (x + start)])
-            stdscr.attroff(curses.color_pair(PAIR_LINK))
-        elif link_match:
-            label, url = link_match.groups()
+        bang, label, url = match.groups()
+        if bang:
+            stdscr.addstr(y, x + start, f"Image: {label} ")
+            stdscr.addnstr(
+                y, x + start + len(f"Image: {label} "), f"({url})", max(0, maxw - (x + start)),
+                curses.color_pair(PAIR_LINK),
+            )
+        else:
             stdscr.addstr(y, x + start, label + " ")
-            stdscr.attron(curses.color_pair(PAIR_LINK))
-            stdscr.addstr(y, x + start + len(label) + 1, f"({url})"[: maxw - (x + start + len(label) + 1)])
-            stdscr.attroff(curses.color_pair(PAIR_LINK))
+            stdscr.addnstr(
+                y, x + start + len(label) + 1, f"({url})", max(0, maxw - (x + start + len(label) + 1)),
+                curses.color_pair(PAIR_LINK),
+            )
         pos = end
     if pos < len(line):
         stdscr.addstr(y, x + pos, line[pos:])
 
 
-def rendered_length(text):
-    """Calculate the rendered length of text after removing markdown inline formatting delimiters."""
-    cursor = 0
-    pattern = re.compile(r"(\*\*([^\*]+)\*\*|\*([^\*]+)\*|`([^`]+)`)")
+@functools.lru_cache(maxsize=4096)
+def _char_width(ch: str) -> int:
+    """Terminal columns taken by one character: 0, 1 or 2 (wide CJK/emoji)."""
+    if unicodedata.combining(ch):
+        return 0
+    return 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+
+
+def _display_width(text: str) -> int:
+    """Terminal column width of `text`; ASCII text is just its length."""
+    if text.isascii():
+        return len(text)
+    return sum(_char_width(ch) for ch in text)
+
+
+def _truncate_to_width(text: str, width: int) -> str:
+    """Cut `text` to at most `width` terminal columns."""
+    # No character is wider than 2 columns, so short text always fits.
+    if text.isascii() or len(text) * 2 <= width:
+        return text[:max(0, width)]
+    cols = 0
+    for i, ch in enumerate(text):
+        cols += _char_width(ch)
+        if cols > width:
+            return text[:i]
+    return text
+
+
+# Color pair for each named group of _INLINE_FORMAT_RE.
+_INLINE_STYLE_PAIRS = {"bold": PAIR_BOLD, "italic": PAIR_ITALIC, "code": PAIR_CODE}
+
+
+@functools.lru_cache(maxsize=1024)
+def _tokenize_inline(text: str) -> Tuple[Tuple[int, str], ...]:
+    """Split text into (pair, text) runs with the emphasis markers removed.
+
+    `pair` is the color pair of a **bold**, *italic* or `code` span, or 0 for
+    plain text. Drawing and width measurement share the cached result, so a
+    line is scanned once however often it is rendered.
+    """
+    tokens = []
     last_end = 0
-    for match in pattern.finditer(text):
+    for match in _INLINE_FORMAT_RE.finditer(text):
         start, end = match.span()
         if start > last_end:
-            cursor += (start - last_end)
-        if match.group(2):  # bold
-            cursor += len(match.group(2))
-        elif match.group(3):  # italic
-            cursor += len(match.group(3))
-        elif match.group(4):  # inline code
-            cursor += len(match.group(4))
+            tokens.append((0, text[last_end:start]))
+        tokens.append((_INLINE_STYLE_PAIRS[match.lastgroup], match.group(match.lastgroup)))
         last_end = end
     if last_end < len(text):
-        cursor += (len(text) - last_end)
-    return cursor
+        tokens.append((0, text[last_end:]))
+    return tuple(tokens)
+
+
+def rendered_length(text):
+    """Calculate the rendered length of text after removing markdown inline formatting delimiters."""
+    return sum(_display_width(part) for _, part in _tokenize_inline(text))
 
 
-def format_inline(line, stdscr, y, x, maxw):
+def format_inline(line, stdscr, y, x, maxw, attr=0):
     """Render inline Markdown emphasis (bold/italic/code) onto the curses screen.
 
+    Plain text is drawn with `attr`. Emphasized spans swap in their own color
+    pair but keep the rest of `attr` (e.g. A_BOLD in headings). Every span is a
+    single addstr with an explicit attribute, so the window's own attributes
+    are never changed.
+
     This function is intentionally conservative about screen bounds to avoid
     `_curses.error: addwstr() returned ERR` when text would overflow the window.
     """
     cursor = 0
-    pattern = re.compile(r"(\*\*([^\*]+)\*\*|\*([^\*]+)\*|`([^`]+)`)")
-    last_end = 0
     max_y, max_x = stdscr.getmaxyx()
+    span_base = attr & ~curses.A_COLOR
 
-    def _add(text: str, attr: int | None = None) -> None:
+    def _add(text: str, span_attr: int) -> None:
         nonlocal cursor
         if not text:
             return
@@ -1543,43 +2147,34 @@ def format_inline(line, stdscr, y, x, maxw):
         avail = min(maxw, max_x) - start_x
         if avail <= 0:
             return
-        chunk = text[:avail]
+        chunk = _truncate_to_width(text, avail)
         try:
-            if attr is not None:
-                stdscr.attron(attr)
-            stdscr.addstr(y, start_x, chunk)
+            stdscr.addstr(y, start_x, chunk, span_attr)
         except curses.error:
             # Ignore draw errors caused by terminal/window edge cases.
             pass
-        finally:
-            if attr is not None:
-                try:
-                    stdscr.attroff(attr)
-                except curses.error:
-                    pass
-        cursor += len(chunk)
+        cursor += _display_width(chunk)
 
-    for match in pattern.finditer(line):
-        start, end = match.span()
-        if start > last_end:
-            _add(line[last_end:start])
+    for pair, text in _tokenize_inline(line):
+        _add(text, curses.color_pair(pair) | span_base if pair else attr)
 
-        if match.group(2):  # bold
-            _add(match.group(2), curses.color_pair(PAIR_BOLD))
-        elif match.group(3):  # italic
-            _add(match.group(3), curses.color_pair(PAIR_ITALIC))
-        elif match.group(4):  # inline code
-            _add(match.group(4), curses.color_pair(PAIR_CODE))
 
-        last_end = end
+def _table_cells(line: str) -> List[str]:
+    """Split a pipe-table line into its stripped cell texts."""
+    return [cell.strip() for cell in line.strip("| \t").split("|")]
+
 
-    if last_end < len(line):
-        _add(line[last_end:])
+def _is_table_separator_cell(cell: str) -> bool:
+    """True for a separator cell: dashes with at most one ':' after the first.
+
+    Same test as the regex ^-+:?-*$, done with string methods.
+    """
+    return cell[:1] == "-" and not cell.replace(":", "", 1).strip("-")
 
 
 def parse_table(lines, start_idx):
     """Parse a markdown table starting from start_idx, return table data and number of lines consumed."""
-    if start_idx >= len(lines) or not lines[start_idx].strip().startswith("|"):
+    if start_idx >= len(lines) or not lines[start_idx].lstrip().startswith("|"):
         return None, 0
     
     table_data = []
@@ -1587,7 +2182,7 @@ def parse_table(lines, start_idx):
     current_line = start_idx
     
     # Parse header
-    header = [cell.strip() for cell in lines[current_line].strip("| \t").split("|")]
+    header = _table_cells(lines[current_line])
     if not header:
         return None, 0
     table_data.append(header)
@@ -1595,16 +2190,16 @@ def parse_table(lines, start_idx):
     current_line += 1
     
     # Parse separator line
-    if current_line >= len(lines) or not lines[current_line].strip().startswith("|"):
+    if current_line >= len(lines) or not lines[current_line].lstrip().startswith("|"):
         return None, 0
-    separator = lines[current_line].strip("| \t").split("|")
-    if len(separator) != len(header) or not all(re.match(r"^-+:?-*$", cell.strip()) for cell in separator):
+    separator = _table_cells(lines[current_line])
+    if len(separator) != len(header) or not all(_is_table_separator_cell(cell) for cell in separator):
         return None, 0
     current_line += 1
     
     # Parse rows
-    while current_line < len(lines) and lines[current_line].strip().startswith("|"):
-        row = [cell.strip() for cell in lines[current_line].strip("| \t").split("|")]
+    while current_line < len(lines) and lines[current_line].lstrip().startswith("|"):
+        row = _table_cells(lines[current_line])
         if len(row) != len(header):
             break
         table_data.append(row)
@@ -1615,62 +2210,134 @@ def parse_table(lines, start_idx):
     return table_data, col_widths, current_line - start_idx
 
 
-def render_row(stdscr, y, row, col_widths, x, maxw):
+def render_row(stdscr, y, row, col_widths, x, maxw, attr=0):
     """Render a single table row with breathing room (space on both sides of content)."""
-    stdscr.addstr(y, x, "│")
+    # Rows of plain single-width text that fit on screen are one addstr.
+    if all(
+        "*" not in cell and "`" not in cell and cell.isascii() and cell.isprintable()
+        for cell in row
+    ):
+        line = "│ " + " │ ".join(cell.ljust(w) for cell, w in zip(row, col_widths)) + " │"
+        if x + len(line) <= min(maxw, stdscr.getmaxyx()[1]):
+            stdscr.addstr(y, x, line, attr)
+            return 1
+    stdscr.addstr(y, x, "│", attr)
     current_x = x + 1
     for i, cell in enumerate(row):
         # Left padding space
-        stdscr.addstr(y, current_x, " ")
+        stdscr.addstr(y, current_x, " ", attr)
         content_x = current_x + 1
         # Render cell content with inline formatting
-        format_inline(cell, stdscr, y, content_x, maxw)
+        format_inline(cell, stdscr, y, content_x, maxw, attr)
         rl = rendered_length(cell)
         # Right padding: fill up to col_widths[i] (content width) + 1 extra space
         pad_x = content_x + rl
         pad_len = col_widths[i] - rl + 1
         if pad_len > 0:
-            stdscr.addstr(y, pad_x, " " * pad_len)
+            stdscr.addstr(y, pad_x, " " * pad_len, attr)
         border_x = content_x + col_widths[i] + 1
-        stdscr.addstr(y, border_x, "│")
+        stdscr.addstr(y, border_x, "│", attr)
         current_x = border_x + 1
     return 1
 
 
+@functools.lru_cache(maxsize=64)
+def _table_borders(col_widths: Tuple[int, ...]) -> Tuple[str, str, str]:
+    """Return the (top, separator, bottom) border lines for a table.
+
+    The horizontal segments (+2 for spaces on both sides of content) are the
+    same for all three borders, so they are built once and joined with the
+    matching corner and junction characters. Box-drawing characters are one
+    column wide, so the borders can be clipped to a width by slicing.
+    """
+    segments = ["─" * (w + 2) for w in col_widths]
+    top = "┌" + "┬".join(segments) + "┐"
+    sep = "├" + "┼".join(segments) + "┤"
+    bot = "└" + "┴".join(segments) + "┘"
+    return top, sep, bot
+
+
 def render_table(table_data, col_widths, stdscr, y, x, maxw):
     """Render a table using ASCII box-drawing characters with inline formatting and breathing room."""
     if not table_data:
         return 0
         
-    stdscr.attron(curses.color_pair(PAIR_TABLE))  # Table color
+    attr = curses.color_pair(PAIR_TABLE)  # Table color
     lines_used = 0
+    top_border, sep_border, bot_border = _table_borders(tuple(col_widths))
+    limit = max(0, maxw - x)
     
-    # Draw top border: +2 for spaces on both sides of content
-    top_border = "┌" + "┬".join("─" * (w + 2) for w in col_widths) + "┐"
-    stdscr.addstr(y, x, top_border[:maxw - x])
+    # Draw top border
+    stdscr.addnstr(y, x, top_border, limit, attr)
     lines_used += 1
     
     # Draw header row
     header = table_data[0]
-    lines_used += render_row(stdscr, y + lines_used, header, col_widths, x, maxw)
+    lines_used += render_row(stdscr, y + lines_used, header, col_widths, x, maxw, attr)
     
     # Draw separator
-    sep_border = "├" + "┼".join("─" * (w + 2) for w in col_widths) + "┤"
-    stdscr.addstr(y + lines_used, x, sep_border[:maxw - x])
+    stdscr.addnstr(y + lines_used, x, sep_border, limit, attr)
     lines_used += 1
     
     # Draw data rows
     for row in table_data[1:]:
-        lines_used += render_row(stdscr, y + lines_used, row, col_widths, x, maxw)
+        lines_used += render_row(stdscr, y + lines_used, row, col_widths, x, maxw, attr)
     
     # Draw bottom border
-    bot_border = "└" + "┴".join("─" * (w + 2) for w in col_widths) + "┘"
-    stdscr.addstr(y + lines_used, x, bot_border[:maxw - x])
+    stdscr.addnstr(y + lines_used, x, bot_border, limit, attr)
     lines_used += 1
     
-    stdscr.attroff(curses.color_pair(PAIR_TABLE))
     return lines_used
 
+def _draw_line_block(stdscr, y, x, lines, attr) -> int:
+    """Draw `lines` on consecutive rows from (y, x) under one attron/attroff.
+
+    Stops at the bottom of the window and returns the number of rows drawn.
+    The lines can't be joined into one addstr: curses continues after a
+    newline at column 0, not at x.
+    """
+    rows = max(0, min(len(lines), stdscr.getmaxyx()[0] - y))
+    stdscr.attron(attr)
+    try:
+        for i in range(rows):
+            stdscr.addstr(y + i, x, lines[i])
+    finally:
+        stdscr.attroff(attr)
+    return rows
+
+
+def _load_mermaid() -> bool:
+    """Import the Mermaid renderer on first use; return whether it's usable."""
+    global _parse_mermaid, _render_ascii, _MERMAID_LIB_AVAILABLE
+    if _MERMAID_LIB_AVAILABLE and (_parse_mermaid is None or _render_ascii is None):
+        try:
+            from mermaid_ascii import parse_mermaid, render_ascii
+            _parse_mermaid, _render_ascii = parse_mermaid, render_ascii
+        except Exception:
+            _MERMAID_LIB_AVAILABLE = False
+    return _MERMAID_LIB_AVAILABLE and _parse_mermaid is not None and _render_ascii is not None
+
+
+@functools.lru_cache(maxsize=32)
+def _render_mermaid_lines(diagram_content: str, ascii_only: bool) -> Tuple[str, ...]:
+    """Render Mermaid source to text lines via `mermaid-ascii-diagrams` (cached).
+
+    With `ascii_only`, box-drawing characters are mapped to ASCII. Raises if
+    the diagram can't be parsed or rendered; failures are not cached.
+    """
+    diagram = _parse_mermaid(diagram_content)
+    out = _render_ascii(diagram)
+    if ascii_only:
+        out = out.translate(_UNICODE_TO_ASCII)
+    return tuple(out.rstrip("\n").splitlines()) if out else ()
+
+
+@functools.lru_cache(maxsize=32)
+def _mermaid_source_lines(diagram_content: str) -> Tuple[str, ...]:
+    """Split Mermaid source into lines for the raw fallback (cached)."""
+    return tuple(diagram_content.splitlines())
+
+
 def render_mermaid(diagram_content, stdscr, y, x, maxw, color_attr):
     """Render a Mermaid fenced block.
 
@@ -1687,56 +2354,51 @@ def render_mermaid(diagram_content, stdscr, y, x, maxw, color_attr):
     avail = max(0, min(maxw, max_x) - x)
 
     def _draw_lines(lines):
-        lines_used = 0
-        for line in lines:
-            if y + lines_used >= max_y:
-                break
-            # Preserve the diagram's layout by not wrapping; just truncate to width.
-            text = (prefix + line)[:avail]
-            stdscr.attron(color_attr)
-            stdscr.addstr(y + lines_used, x, text)
-            stdscr.attroff(color_attr)
-            lines_used += 1
-        return lines_used
-
-    if not _MERMAID_LIB_AVAILABLE or _parse_mermaid is None or _render_ascii is None:
-        return _draw_lines(diagram_content.splitlines())
+        # Preserve the diagram's layout by not wrapping; just truncate to width.
+        visible = [_truncate_to_width(prefix + line, avail) for line in lines[:max(0, max_y - y)]]
+        return _draw_line_block(stdscr, y, x, visible, color_attr)
+
+    if not _load_mermaid():
+        return _draw_lines(_mermaid_source_lines(diagram_content))
 
     try:
-        diagram = _parse_mermaid(diagram_content)
-        out = _render_ascii(diagram)
-        if _USE_ASCII_MERMAID_FALLBACK:
-            out = out.translate(_UNICODE_TO_ASCII)
-        rendered_lines = out.rstrip("\n").splitlines() if out else []
-        return _draw_lines(rendered_lines or diagram_content.splitlines())
+        rendered_lines = _render_mermaid_lines(diagram_content, _USE_ASCII_MERMAID_FALLBACK)
+        return _draw_lines(rendered_lines or _mermaid_source_lines(diagram_content))
     except Exception:
         # Rendering should never break the slideshow: fall back to raw Mermaid.
-        return _draw_lines(diagram_content.splitlines())
+        return _draw_lines(_mermaid_source_lines(diagram_content))
 
-    # Render via mermaid-ascii-diagrams
-    try:
-        out = _mermaid_render(diagram_content)
-        if _USE_ASCII_MERMAID_FALLBACK:
-            out = out.translate(_UNICODE_TO_ASCII)
-        lines = out.rstrip("\n").splitlines() if out else []
-    except Exception as e:
-        # If rendering fails, show a short error line + raw input (so the slide still works)
-        err = f"{type(e).__name__}: {e}"
-        lines = ["[mermaid render failed] " + err, ""] + diagram_content.splitlines()
 
-    lines_used = 0
-    max_y, max_x = stdscr.getmaxyx()
-    for line in lines:
-        if y + lines_used >= max_y:
-            break
-        avail = max(0, min(maxw, max_x) - x)
-        stdscr.attron(color_attr)
-        stdscr.addstr(y + lines_used, x, line[:avail])
-        stdscr.attroff(color_attr)
-        lines_used += 1
-    return lines_used
+def _parse_heading(line: str) -> Optional[Tuple[int, str]]:
+    """Parse an ATX heading ("## Title") into (level, text), else None."""
+    if not line.startswith("#"):
+        return None
+    level = len(line) - len(line.lstrip("#"))
+    if line[level:level + 1] != " ":
+        return None
+    return level, line[level + 1:].strip()
+
 
+def _parse_task_item(stripped: str) -> Optional[Tuple[str, str]]:
+    """Parse a task list item ("- [x] done") into (state, text), else None.
 
+    `stripped` is the line without surrounding whitespace. The marker may be
+    -, * or +, and state is " ", "x" or "X".
+    """
+    if stripped[:1] not in ("-", "*", "+"):
+        return None
+    # Whitespace after the marker, then "[ ]", "[x]" or "[X]".
+    box = stripped[1:].lstrip()
+    if len(box) == len(stripped) - 1 or box[:1] != "[" or box[2:3] != "]":
+        return None
+    if box[1:2] not in (" ", "x", "X"):
+        return None
+    # Whitespace again, then the item text.
+    rest = box[3:]
+    text = rest.lstrip()
+    if len(text) == len(rest):
+        return None
+    return box[1], text
 
 
 def format_text(line, stdscr, y, x, maxw, fig_slide, lines=None, line_idx=0):
@@ -1747,40 +2409,56 @@ def format_text(line, stdscr, y, x, maxw, fig_slide, lines=None, line_idx=0):
             rendered = render_table(table_data, col_widths, stdscr, y, x, maxw)
             return rendered, lines_consumed
     
-    if re.search(r"!\[[^\]]*\]\([^)]*\)|\[[^\]]*\]\([^)]*\)", line):
-        render_links(line, stdscr, y, x, maxw)
-        return 1, 1
-    if line.strip().startswith(">"):
-        text = line.lstrip("> ").strip()
-        stdscr.attron(curses.color_pair(PAIR_BLOCKQUOTE))
-        stdscr.addstr(y, x, "│ ")
-        format_inline(text, stdscr, y, x + 2, maxw)
-        stdscr.attroff(curses.color_pair(PAIR_BLOCKQUOTE))
-        return 1, 1
-    m = re.match(r"^(#+) (.*)$", line)
-    if m:
-        level = len(m.group(1))
-        text = m.group(2).strip()
-        if level == 1:
-            ascii_title = fig_slide.renderText(text)
-            stdscr.attron(curses.color_pair(PAIR_HEADING_1) | curses.A_BOLD)
-            title_lines = ascii_title.splitlines()
-            for i, l in enumerate(title_lines):
-                if y + i < stdscr.getmaxyx()[0]:
-                    stdscr.addstr(y + i, x, l[:maxw - x])
-            stdscr.attroff(curses.color_pair(PAIR_HEADING_1) | curses.A_BOLD)
-            return len(title_lines), 1
-        elif level == 2:
-            stdscr.attron(curses.color_pair(PAIR_HEADING_2) | curses.A_BOLD)
-            format_inline(text, stdscr, y, x, maxw)
-            stdscr.attroff(curses.color_pair(PAIR_HEADING_2) | curses.A_BOLD)
-            return 1, 1
-        else:
-            stdscr.attron(curses.color_pair(PAIR_HEADING_3) | curses.A_BOLD)
-            format_inline(text, stdscr, y, x, maxw)
-            stdscr.attroff(curses.color_pair(PAIR_HEADING_3) | curses.A_BOLD)
-            return 1, 1
+    kind, text = _classify_line(line)
+    if kind == "plain":
+        format_inline(text, stdscr, y, x, maxw)
+    elif kind == "bullet":
+        format_inline(text, stdscr, y, x, maxw, curses.color_pair(PAIR_BULLET))
+    elif kind == "links":
+        render_links(text, stdscr, y, x, maxw)
+    elif kind == "quote":
+        stdscr.addstr(y, x, "│ ", curses.color_pair(PAIR_BLOCKQUOTE))
+        format_inline(text, stdscr, y, x + 2, maxw, curses.color_pair(PAIR_BLOCKQUOTE))
+    elif kind == "h1":
+        title_lines = _figlet_render(fig_slide.font, fig_slide.width, text)
+        _draw_line_block(
+            stdscr, y, x,
+            [_truncate_to_width(l, maxw - x) for l in title_lines],
+            curses.color_pair(PAIR_HEADING_1) | curses.A_BOLD,
+        )
+        return len(title_lines), 1
+    elif kind == "h2":
+        format_inline(text, stdscr, y, x, maxw, curses.color_pair(PAIR_HEADING_2) | curses.A_BOLD)
+    elif kind == "h3":
+        format_inline(text, stdscr, y, x, maxw, curses.color_pair(PAIR_HEADING_3) | curses.A_BOLD)
+    elif kind == "done":
+        box = "[x]" if _USE_ASCII_CHECKBOXES else "☑"  # U+2611
+        format_inline(f"{box} {text}", stdscr, y, x, maxw, curses.color_pair(PAIR_CHECKBOX_CHECKED))
+    else:  # "todo"
+        box = "[ ]" if _USE_ASCII_CHECKBOXES else "☐"  # U+2610
+        format_inline(f"{box} {text}", stdscr, y, x, maxw, curses.color_pair(PAIR_BULLET))
+    return 1, 1
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_line(line: str) -> Tuple[str, str]:
+    """Work out how `format_text` draws a non-table line (cached).
+
+    Returns (kind, text): "links" and "plain" carry the line itself; "quote",
+    "h1"-"h3", "done"/"todo" (task items) and "bullet" carry the text left
+    after their marker. Checks run in precedence order, so e.g. a heading
+    containing a link is drawn as links.
+    """
     stripped = line.strip()
+    # Every link or image has a "[", so most lines skip the regex entirely.
+    if "[" in line and _INLINE_LINK_RE.search(line):
+        return "links", line
+    if stripped.startswith(">"):
+        return "quote", line.lstrip("> ").strip()
+    heading = _parse_heading(line)
+    if heading:
+        level, text = heading
+        return f"h{min(level, 3)}", text
 
     # Task list items (checkboxes)
     # Supports:
@@ -1789,81 +2467,311 @@ def format_text(line, stdscr, y, x, maxw, fig_slide, lines=None, line_idx=0):
     # - [X] checked
     # * [ ] unchecked
     # + [ ] unchecked
-    m_task = re.match(r"^[-*+]\s+\[( |x|X)\]\s+(.*)$", stripped)
-    if m_task:
-        state, text = m_task.group(1), m_task.group(2)
-
-        use_ascii = bool(os.environ.get("TERMSLIDE_ASCII_CHECKBOXES")) or not _utf8_probably_supported()
-        if state in ("x", "X"):
-            box = "[x]" if use_ascii else "☑"  # U+2611
-            color = curses.color_pair(PAIR_CHECKBOX_CHECKED)
-        else:
-            box = "[ ]" if use_ascii else "☐"  # U+2610
-            color = curses.color_pair(PAIR_BULLET)
-
-        stdscr.attron(color)
-        format_inline(f"{box} {text}", stdscr, y, x, maxw)
-        stdscr.attroff(color)
-        return 1, 1
+    task = _parse_task_item(stripped)
+    if task:
+        state, text = task
+        return "done" if state in ("x", "X") else "todo", text
 
     # Normal unordered list items
     if stripped.startswith("- "):
-        line = "• " + stripped[2:]
-        stdscr.attron(curses.color_pair(PAIR_BULLET))
-        format_inline(line, stdscr, y, x, maxw)
-        stdscr.attroff(curses.color_pair(PAIR_BULLET))
-        return 1, 1
-    format_inline(line, stdscr, y, x, maxw)
-    return 1, 1
+        return "bullet", "• " + stripped[2:]
+    return "plain", line
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_content_nodes(content: str) -> Tuple[tuple, ...]:
+    """Split a slide body into render nodes (cached per content string).
+
+    Fences and tables only depend on the text, so they are found once
+    instead of on every render. Node kinds:
+
+    - ("line", text): a single Markdown line, drawn by `format_text`.
+    - ("code", language, lines): a fenced code block.
+    - ("mermaid", diagram_text): a ```mermaid block.
+    - ("table", table_data, col_widths): a pipe table from `parse_table`.
+
+    An unterminated fence swallows the rest of the slide, as before.
+    """
+    lines = content.split("\n")
+    nodes = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            language = stripped[3:].strip() or "text"
+            end = i + 1
+            while end < len(lines) and not lines[end].strip().startswith("```"):
+                end += 1
+            if end < len(lines):
+                code_lines = lines[i + 1:end]
+                if language == "mermaid":
+                    nodes.append(("mermaid", "\n".join(code_lines)))
+                else:
+                    nodes.append(("code", language, tuple(code_lines)))
+            i = end + 1
+            continue
+        if stripped.startswith("|"):
+            table_info = parse_table(lines, i)
+            if table_info[0] is not None:
+                table_data, col_widths, lines_consumed = table_info
+                nodes.append(("table", table_data, col_widths))
+                i += lines_consumed
+                continue
+        nodes.append(("line", line))
+        i += 1
+    return tuple(nodes)
 
 
 def render_content(stdscr, content, start_y, start_x, maxw, fig_slide):
     """Render a slide's body content, including fenced code blocks and tables."""
+    if not content or content.isspace():
+        return
     img_info = parse_image_only(content)
     if img_info:
         path, alt = img_info
         render_image_in_curses(stdscr, path, alt)
         return
-    lines = content.split("\n")
+    max_x = stdscr.getmaxyx()[1]
     y = start_y
-    i = 0
-    in_code = False
-    language = None
-    code_lines = []
-    while i < len(lines):
-        line = lines[i]
-        if line.strip().startswith("```"):
-            if not in_code:
-                lang = line.strip()[3:].strip()
-                language = lang if lang else "text"
-                in_code = True
-                code_lines = []
-                i += 1
+    for node in _parse_content_nodes(content):
+        kind = node[0]
+        if kind == "line":
+            y += format_text(node[1], stdscr, y, start_x, maxw, fig_slide)[0]
+        elif kind == "table":
+            y += render_table(node[1], node[2], stdscr, y, start_x, maxw)
+        elif kind == "mermaid":
+            y += render_mermaid(node[1], stdscr, y, start_x, maxw, curses.color_pair(PAIR_TABLE))
+        else:
+            code_lines = node[2]
+            if start_x < max_x:
+                width = maxw - (start_x + 2)
+                _draw_line_block(
+                    stdscr, y, start_x,
+                    ["│ " + _truncate_to_width(code_line, width) for code_line in code_lines],
+                    curses.color_pair(PAIR_CODE),
+                )
+            y += len(code_lines)
+
+
+class FrameBuffer:
+    """Off-screen copy of the terminal that slides are composed into.
+
+    It implements the part of the curses window API the renderers use
+    (`addstr`, `addnstr`, `attron`, `attroff`, `getmaxyx`) with curses' clipping,
+    wrapping and error behavior, so the same drawing code works against
+    either. `flush` then writes only the cells that changed since the
+    previous flush to the real screen, one `addstr` per attribute run. A new
+    buffer assumes the screen it flushes to has just been cleared.
+    """
+
+    def __init__(self, height: int, width: int):
+        self.height = height
+        self.width = width
+        self._attr = 0
+        self.erase()
+        # What the screen currently shows: blank, until the first flush.
+        self._shown = (self.chars, self.attrs)
+        self.erase()
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self.height, self.width
+
+    def erase(self) -> None:
+        """Blank the buffer for a new frame."""
+        self.chars = [[" "] * self.width for _ in range(self.height)]
+        self.attrs = [[0] * self.width for _ in range(self.height)]
+
+    def snapshot(self) -> Tuple[List[List[str]], List[List[int]]]:
+        """Return the composed frame for `restore`.
+
+        `erase` replaces the grids instead of clearing them in place, so the
+        snapshot is never modified by later drawing.
+        """
+        return self.chars, self.attrs
+
+    def restore(self, snapshot: Tuple[List[List[str]], List[List[int]]]) -> None:
+        """Make a frame from `snapshot` the current contents."""
+        self.chars, self.attrs = snapshot
+
+    def attron(self, attr: int) -> None:
+        # Like ncurses: a color pair replaces the current one.
+        if attr & curses.A_COLOR:
+            self._attr = (self._attr & ~curses.A_COLOR) | attr
+        else:
+            self._attr |= attr
+
+    def attroff(self, attr: int) -> None:
+        # Like ncurses: turning off any color pair clears the color.
+        if attr & curses.A_COLOR:
+            self._attr &= ~(attr | curses.A_COLOR)
+        else:
+            self._attr &= ~attr
+
+    def addstr(self, y: int, x: int, text: str, attr: Optional[int] = None) -> None:
+        """Draw `text` at (y, x), wrapping at the right edge like curses.
+
+        Raises curses.error where curses would: when (y, x) is off-screen or
+        the text runs past the bottom-right corner (cells before that point
+        are still drawn).
+        """
+        if attr is None:
+            attr = self._attr
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise curses.error("addwstr() returned ERR")
+        if "\t" in text or "\n" in text or "\r" in text or not (
+            text.isascii() or all(_char_width(ch) == 1 for ch in text)
+        ):
+            self._addstr_slow(y, x, text, attr)
+            return
+
+        # Every character takes exactly one cell: copy whole row slices.
+        width = self.width
+        while True:
+            n = min(len(text), width - x)
+            row = self.chars[y]
+            self._split_wide(row, x, x + n)
+            row[x:x + n] = text[:n]
+            self.attrs[y][x:x + n] = [attr] * n
+            text = text[n:]
+            x += n
+            if x >= width:
+                if y == self.height - 1:
+                    raise curses.error("addwstr() returned ERR")
+                y += 1
+                x = 0
+            if not text:
+                return
+
+    def addnstr(self, y: int, x: int, text: str, n: int, attr: Optional[int] = None) -> None:
+        """`addstr` of at most `n` characters of `text` (all of it if n < 0)."""
+        self.addstr(y, x, text if n < 0 else text[:n], attr)
+
+    def _split_wide(self, row: List[str], start: int, end: int) -> None:
+        """Blank the halves of wide characters cut by a write to row[start:end].
+
+        A wide character is stored in its first cell, with "" in the second.
+        """
+        if 0 < start < self.width and row[start] == "":
+            row[start - 1] = " "
+        if end < self.width and row[end] == "":
+            row[end] = " "
+
+    def _addstr_slow(self, y: int, x: int, text: str, attr: int) -> None:
+        """`addstr` one character at a time, for control or non-single-width text."""
+        for ch in text:
+            if ch == "\n":
+                # Newline clears to the end of the line and moves down.
+                self._split_wide(self.chars[y], x, self.width)
+                self.chars[y][x:] = [" "] * (self.width - x)
+                self.attrs[y][x:] = [attr] * (self.width - x)
+                y += 1
+                x = 0
+                if y >= self.height:
+                    raise curses.error("addwstr() returned ERR")
                 continue
-            else:
-                in_code = False
-                if language == "mermaid":
-                    diagram_content = "\n".join(code_lines)
-                    consumed = render_mermaid(diagram_content, stdscr, y, start_x, maxw, curses.color_pair(PAIR_TABLE))
-                    y += consumed
-                else:
-                    for code_line in code_lines:
-                        stdscr.attron(curses.color_pair(PAIR_CODE))
-                        if y < stdscr.getmaxyx()[0] and start_x < stdscr.getmaxyx()[1]:
-                            stdscr.addstr(y, start_x, "│ " + code_line[:maxw - (start_x + 2)])
-                        stdscr.attroff(curses.color_pair(PAIR_CODE))
-                        y += 1
-                language = None
-                code_lines = []
-                i += 1
+            if ch == "\r":
+                x = 0
                 continue
-        if in_code:
-            code_lines.append(line)
-            i += 1
-            continue
-        consumed = format_text(line, stdscr, y, start_x, maxw, fig_slide, lines, i)
-        y += consumed[0]  # Use rendered_consumed
-        i += consumed[1]  # Use source_consumed
+            cw = _char_width(ch)
+            if cw == 0:
+                # Combining marks join the character before them.
+                row = self.chars[y]
+                prev = x - 1
+                while prev > 0 and row[prev] == "":
+                    prev -= 1
+                if prev >= 0:
+                    row[prev] += ch
+                continue
+            # Tabs expand to blanks up to the next multiple of 8.
+            for c in (" " * (8 - x % 8) if ch == "\t" else ch):
+                if cw == 2 and x == self.width - 1:
+                    # A wide character that doesn't fit wraps to the next line.
+                    y, x = self._put_cell(y, x, " ", 1, attr)
+                y, x = self._put_cell(y, x, c, cw, attr)
+
+    def _put_cell(self, y: int, x: int, ch: str, cw: int, attr: int) -> Tuple[int, int]:
+        """Store a character `cw` cells wide at (y, x); return the next position."""
+        row = self.chars[y]
+        self._split_wide(row, x, x + cw)
+        row[x] = ch
+        self.attrs[y][x] = attr
+        if cw == 2:
+            row[x + 1] = ""
+            self.attrs[y][x + 1] = attr
+        x += cw
+        if x >= self.width:
+            if y == self.height - 1:
+                raise curses.error("addwstr() returned ERR")
+            y += 1
+            x = 0
+        return y, x
+
+    def flush(self, stdscr) -> None:
+        """Write the cells that changed since the last flush to `stdscr`.
+
+        Unchanged rows are skipped; a changed row is redrawn from its first
+        to its last differing cell. Re-flushing the frame that is already on
+        screen (e.g. a restored snapshot of the same slide) is a no-op.
+        """
+        shown_chars, shown_attrs = self._shown
+        if self.chars is shown_chars and self.attrs is shown_attrs:
+            return
+        for y in range(self.height):
+            chars, attrs = self.chars[y], self.attrs[y]
+            old_chars, old_attrs = shown_chars[y], shown_attrs[y]
+            if chars == old_chars and attrs == old_attrs:
+                continue
+            left, right = 0, self.width - 1
+            while chars[left] == old_chars[left] and attrs[left] == old_attrs[left]:
+                left += 1
+            while chars[right] == old_chars[right] and attrs[right] == old_attrs[right]:
+                right -= 1
+            # Never start or end a write in the middle of a wide character.
+            while left > 0 and chars[left] == "":
+                left -= 1
+            while right + 1 < self.width and chars[right + 1] == "":
+                right += 1
+
+            x = left
+            while x <= right:
+                attr = attrs[x]
+                end = x + 1
+                while end <= right and attrs[end] == attr:
+                    end += 1
+                try:
+                    stdscr.addstr(y, x, "".join(chars[x:end]), attr)
+                except curses.error:
+                    # Writing the bottom-right cell reports ERR after drawing it.
+                    pass
+                x = end
+        self._shown = (self.chars, self.attrs)
+
+
+def _compose_slide(frame, slides, idx, fig_title, fig_slide) -> None:
+    """Draw slide `idx` (title art, body and status line) into `frame`."""
+    h, w = frame.getmaxyx()
+    slide_type, title, content = slides[idx]
+    if slide_type == "title":
+        lines = _figlet_render(fig_title.font, fig_title.width, title)
+        start_y = max(0, (h - len(lines)) // 2)
+        frame.attron(curses.color_pair(PAIR_HEADING_1) | curses.A_BOLD)
+        for i, line in enumerate(lines):
+            if start_y + i < h:
+                frame.addstr(start_y + i, max(0, (w - _display_width(line)) // 2), line)
+        frame.attroff(curses.color_pair(PAIR_HEADING_1) | curses.A_BOLD)
+        if content and not content.isspace():
+            render_content(frame, content, start_y + len(lines) + 2, max(0, w // 4), w, fig_slide)
+    else:
+        if title:
+            title_lines = _figlet_render(fig_slide.font, fig_slide.width, title)
+            _draw_line_block(frame, 1, 2, title_lines, curses.color_pair(PAIR_HEADING_1) | curses.A_BOLD)
+            offset = len(title_lines) + 2
+        else:
+            offset = 1
+        render_content(frame, content, offset, 4, w, fig_slide)
+        if h - 1 < h and 2 < w:
+            frame.addstr(h - 1, 2, f"Slide {idx+1}/{len(slides)}  ←/→ to navigate, q to quit")
 
 
 def run_slideshow(stdscr, slides, theme: Dict[str, Any]):
@@ -1884,40 +2792,49 @@ def run_slideshow(stdscr, slides, theme: Dict[str, Any]):
     title_font = _safe_figlet_font(figlet_cfg.get("title"), _DEFAULT_FIGLET_TITLE_FONT)
     slide_font = _safe_figlet_font(figlet_cfg.get("slide"), _DEFAULT_FIGLET_SLIDE_FONT)
 
-    fig_title = Figlet(font=title_font, width=w)
-    fig_slide = Figlet(font=slide_font, width=w)
+    fig_title = _FigletStyle(title_font, w)
+    fig_slide = _FigletStyle(slide_font, w)
     idx = 0
+    frame = None
+    # Composed frames of slides already shown at the current size, by index.
+    slide_frames: Dict[int, tuple] = {}
+    # (idx, h, w) of what is on screen; keys that change neither the slide
+    # nor the size (unbound keys, paging past either end) redraw nothing.
+    shown = None
 
     while True:
-        stdscr.clear()
         h, w = stdscr.getmaxyx()
-        slide_type, title, content = slides[idx]
-        if slide_type == "title":
-            ascii_title = fig_title.renderText(title)
-            lines = ascii_title.splitlines()
-            start_y = max(0, (h - len(lines)) // 2)
-            stdscr.attron(curses.color_pair(PAIR_HEADING_1) | curses.A_BOLD)
-            for i, line in enumerate(lines):
-                if start_y + i < h:
-                    stdscr.addstr(start_y + i, max(0, (w - len(line)) // 2), line)
-            stdscr.attroff(curses.color_pair(PAIR_HEADING_1) | curses.A_BOLD)
-            if content:
-                render_content(stdscr, content, start_y + len(lines) + 2, max(0, w // 4), w, fig_slide)
-        else:
-            if title:
-                ascii_title = fig_slide.renderText(title)
-                stdscr.attron(curses.color_pair(PAIR_HEADING_1) | curses.A_BOLD)
-                for i, line in enumerate(ascii_title.splitlines()):
-                    if i + 1 < h:
-                        stdscr.addstr(i + 1, 2, line)
-                stdscr.attroff(curses.color_pair(PAIR_HEADING_1) | curses.A_BOLD)
-                offset = len(ascii_title.splitlines()) + 2
+        if (idx, h, w) != shown:
+            if frame is None or frame.getmaxyx() != (h, w):
+                # New or resized screen: start from a blank window. initscr has
+                # just cleared the terminal, so the first frame only needs
+                # erase(); after a resize the terminal may hold reflowed junk,
+                # and clear() makes the next refresh repaint all of it.
+                if frame is None:
+                    stdscr.erase()
+                else:
+                    stdscr.clear()
+                frame = FrameBuffer(h, w)
+                slide_frames.clear()
+
+            # Compose the slide off-screen; only the changes reach the terminal.
+            if idx in slide_frames:
+                frame.restore(slide_frames[idx])
             else:
-                offset = 1
-            render_content(stdscr, content, offset, 4, w, fig_slide)
-            if h - 1 < h and 2 < w:
-                stdscr.addstr(h - 1, 2, f"Slide {idx+1}/{len(slides)}  ←/→ to navigate, q to quit")
-        stdscr.refresh()
+                frame.erase()
+                _compose_slide(frame, slides, idx, fig_title, fig_slide)
+                # Image slides are redrawn each time: another image may have
+                # reassigned their color pairs, and the file may change on disk.
+                if not parse_image_only(slides[idx][2]):
+                    if len(slide_frames) >= _SLIDE_FRAME_CACHE_SIZE:
+                        slide_frames.pop(next(iter(slide_frames)))
+                    slide_frames[idx] = frame.snapshot()
+
+            frame.flush(stdscr)
+            stdscr.refresh()
+
+            shown = (idx, h, w)
+
         key = stdscr.getch()
         if key in (ord("q"), 27):
             break
@@ -1977,7 +2894,7 @@ def main() -> None:
         print(f"Error: {e}", file=sys.stderr)
         raise SystemExit(1)
 
-    if Image is None:
+    if not _pil_installed():
         print("Warning: Pillow not installed, image slides disabled.", file=sys.stderr)
 
     try:
@@ -2015,17 +2932,30 @@ def main() -> None:
             return
 
         msg = "\n".join(msgs)
+        # Encode once; each destination then gets a single binary write.
+        msg_bytes = msg.encode("utf-8", errors="ignore")
         # Prefer showing the message even if stderr/stdout are redirected.
         for stream in (getattr(sys, "__stderr__", None), getattr(sys, "__stdout__", None)):
             try:
-                if stream:
+                if not stream:
+                    continue
+                buffer = getattr(stream, "buffer", None)
+                if buffer is None:
                     print(msg, file=stream, flush=True)
+                    continue
+                stream.flush()
+                buffer.write(msg_bytes + b"\n")
+                buffer.flush()
             except Exception:
                 pass
         try:
-            with open("/dev/tty", "w", encoding="utf-8", errors="ignore") as tty:
-                tty.write(msg)
-                tty.flush()
+            fd = os.open("/dev/tty", os.O_WRONLY)
+            try:
+                view = memoryview(msg_bytes)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
         except Exception:
             pass
 